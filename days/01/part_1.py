@@ -10,26 +10,144 @@ Task: Count how many times the dial points at 0 AFTER rotations.
 - Wraps around (L from 0 goes to 99, R from 99 goes to 0)
 """
 
+import json
+import os
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from itertools import repeat
+from typing import BinaryIO
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python fold
+    np = None
 
-def solve(rotations: list[str]) -> int:
+# Longest distance (in digits) that always fits in an int64
+MAX_INT64_DIGITS = 18
+
+
+class DialState:
     """
-    Solve Part 1: Count times dial ends at 0 after a rotation.
+    Resumable dial state: position, zero count and bytes of input consumed.
+
+    `part` names the puzzle part whose fold produced the zero count, so a
+    checkpoint written by one part is never resumed by the other.
+    """
+
+    def __init__(
+        self,
+        position: int = 50,
+        zero_count: int = 0,
+        offset: int = 0,
+        part: str | None = None,
+    ):
+        self.position = position
+        self.zero_count = zero_count
+        self.offset = offset
+        self.part = part
+
+    def save(self, filename: str):
+        """Write the state to a JSON checkpoint file, replacing it atomically."""
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, "w") as f:
+            json.dump(
+                {
+                    "position": self.position,
+                    "zero_count": self.zero_count,
+                    "offset": self.offset,
+                    "part": self.part,
+                },
+                f,
+            )
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename: str, part: str | None = None) -> "DialState":
+        """
+        Read a checkpoint file, or start fresh if it does not exist yet.
+
+        Raises ValueError if `part` is given and the checkpoint was written
+        by a different part.
+        """
+        if not os.path.exists(filename):
+            return cls(part=part)
+        with open(filename, "r") as f:
+            data = json.load(f)
+        if part is not None and data.get("part") != part:
+            raise ValueError(
+                f"Checkpoint {filename} was written by {data.get('part')}, not {part}"
+            )
+        return cls(**data)
+
+
+class DialSegment:
+    """
+    Summary of a run of rotations that can be combined with its neighbours.
+
+    `net` is the displacement mod 100 and `hits[s]` is the number of zeros
+    counted when the run starts at position s. Combining summaries is
+    associative, so chunks of the input can be summarized independently.
+    """
+
+    def __init__(self, net: int = 0, hits: list[int] | None = None):
+        self.net = net
+        self.hits = hits if hits is not None else [0] * 100
+
+    def combine(self, other: "DialSegment") -> "DialSegment":
+        """Summarize this run followed by `other`."""
+        hits = [self.hits[s] + other.hits[(s + self.net) % 100] for s in range(100)]
+        return DialSegment((self.net + other.net) % 100, hits)
+
+
+def parse_rotations(stream: Iterable[bytes]) -> Iterator[tuple[str, int]]:
+    """
+    Lazily parse rotation instructions from a binary stream.
+
+    Lines are read one at a time from the (buffered) stream, so memory use
+    stays flat no matter how large the rotation log is.
 
     Args:
-        rotations: List of rotation instructions (e.g., ['L68', 'R48', ...])
+        stream: Binary stream (or iterable of byte lines) with one instruction
+            per line (e.g., b'L68')
 
-    Returns:
-        Number of times the dial points at 0 after any rotation
+    Yields:
+        (direction, distance) tuples, e.g. ('L', 68)
     """
-    position = 50  # Starting position
-    zero_count = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        direction = "L" if line[:1] == b"L" else "R"
+        yield direction, int(line[1:])
 
+
+def parse_rotation_strings(rotations: Iterable[str]) -> Iterator[tuple[str, int]]:
+    """Parse instruction strings like 'L68' into (direction, distance) tuples."""
     for rotation in rotations:
-        direction = rotation[0]  # 'L' or 'R'
-        distance = int(rotation[1:])  # Number of clicks
+        yield rotation[0], int(rotation[1:])
+
+
+def open_input(filename: str) -> AbstractContextManager[BinaryIO]:
+    """Open an input file in binary mode, or stdin when filename is '-'."""
+    if filename == "-":
+        return nullcontext(sys.stdin.buffer)
+    return open(filename, "rb")
+
 
+def advance_state(state: DialState, moves: Iterable[tuple[str, int]]):
+    """
+    Fold moves into a dial state, counting rotations that end at 0.
+
+    Args:
+        state: Dial state to update in place
+        moves: Iterable of (direction, distance) tuples
+    """
+    position = state.position
+    zero_count = state.zero_count
+
+    for direction, distance in moves:
         if direction == "L":
             position = (position - distance) % 100
         else:  # direction == 'R'
@@ -38,23 +156,301 @@ def solve(rotations: list[str]) -> int:
         if position == 0:
             zero_count += 1
 
-    return zero_count
+    state.position = position
+    state.zero_count = zero_count
+
+
+def solve_moves(moves: Iterable[tuple[str, int]]) -> int:
+    """
+    Count times the dial ends at 0, folding over parsed moves incrementally.
+
+    Args:
+        moves: Iterable of (direction, distance) tuples
+
+    Returns:
+        Number of times the dial points at 0 after any rotation
+    """
+    state = DialState()
+    advance_state(state, moves)
+    return state.zero_count
+
+
+def summarize_segment(moves: Iterable[tuple[str, int]]) -> DialSegment:
+    """
+    Summarize moves as a DialSegment in a single pass.
+
+    Starting from s, the dial is at (s + offset) % 100 after each rotation,
+    so it ends at 0 exactly when s == -offset (mod 100). Histogramming the
+    running offsets therefore gives the zero count for every start at once.
+    """
+    offset = 0
+    offset_counts = [0] * 100
+
+    for direction, distance in moves:
+        if direction == "L":
+            offset = (offset - distance) % 100
+        else:  # direction == 'R'
+            offset = (offset + distance) % 100
+        offset_counts[offset] += 1
+
+    return DialSegment(offset, [offset_counts[-s % 100] for s in range(100)])
+
+
+def rotation_deltas(rotations: list[str]) -> "np.ndarray | None":
+    """
+    Convert rotations to a signed int64 NumPy array (L negative, R positive).
+
+    The strings become a fixed-width array of character codes, and the
+    distances are accumulated column by column (Horner's rule), so parsing
+    runs in NumPy rather than calling int() once per rotation.
+
+    Returns None when int64 could overflow: a distance of more than
+    MAX_INT64_DIGITS digits, or deltas whose running sum could pass 2**63.
+    Callers then use the pure-Python fold.
+    """
+    if not rotations:
+        return np.zeros(0, dtype=np.int64)
+
+    codes = np.array(rotations).view(np.uint32).reshape(len(rotations), -1)
+    if codes.shape[1] - 1 > MAX_INT64_DIGITS:
+        return None
+    distances = np.zeros(len(rotations), dtype=np.int64)
+    for column in codes[:, 1:].T:
+        # Shorter strings are padded with NUL, which is skipped like whitespace
+        is_digit = (column >= ord("0")) & (column <= ord("9"))
+        shifted = distances * 10 + (column.astype(np.int64) - ord("0"))
+        distances = np.where(is_digit, shifted, distances)
+
+    # Positions are cumulative sums, bounded by count * largest distance
+    # (plus the start position and a little slack for the floor divisions)
+    if len(rotations) * int(distances.max()) + 200 > 2**63 - 1:
+        return None
+    return np.where(codes[:, 0] == ord("L"), -distances, distances)
+
+
+def solve_numpy(rotations: list[str]) -> int:
+    """
+    Vectorized Part 1: positions are a cumulative sum of the deltas mod 100.
+
+    Args:
+        rotations: List of rotation instructions (e.g., ['L68', 'R48', ...])
+
+    Returns:
+        Number of times the dial points at 0 after any rotation
+    """
+    deltas = rotation_deltas(rotations)
+    if deltas is None:
+        # Too large for int64: fold with Python ints instead
+        return solve_moves(parse_rotation_strings(rotations))
+    positions = (50 + np.cumsum(deltas)) % 100
+    return int(np.count_nonzero(positions == 0))
+
+
+def solve(rotations: list[str]) -> int:
+    """
+    Solve Part 1: Count times dial ends at 0 after a rotation.
+
+    Uses the NumPy backend when it is installed, pure Python otherwise.
+
+    Args:
+        rotations: List of rotation instructions (e.g., ['L68', 'R48', ...])
+
+    Returns:
+        Number of times the dial points at 0 after any rotation
+    """
+    if np is not None:
+        return solve_numpy(rotations)
+    return solve_moves(parse_rotation_strings(rotations))
+
+
+def complete_lines(stream: BinaryIO, state: DialState) -> Iterator[bytes]:
+    """
+    Yield newline-terminated lines, advancing `state.offset` past each one.
+
+    A final line without its newline may still be being written, so it is
+    left unread: the next resume starts at its first byte.
+    """
+    for line in stream:
+        if not line.endswith(b"\n"):
+            break
+        state.offset += len(line)
+        yield line
+
+
+def resume_from_file(
+    filename: str,
+    checkpoint: str,
+    advance: Callable[[DialState, Iterable[tuple[str, int]]], None] = advance_state,
+    part: str = "part_1",
+) -> int:
+    """
+    Continue from a checkpoint, processing only lines appended since it was saved.
+
+    Only complete lines are folded and committed to the checkpoint, so a log
+    that is still being appended to can be resumed at any moment.
+
+    Args:
+        filename: Rotation log to read (must be seekable, so not stdin)
+        checkpoint: Path of the JSON checkpoint to load and update
+        advance: Fold function that updates a DialState with moves
+        part: Part that `advance` solves, recorded in (and checked against)
+            the checkpoint
+
+    Returns:
+        Zero count over the whole log so far
+    """
+    if filename == "-":
+        raise ValueError("Checkpoints need a seekable input file, not stdin")
+
+    state = DialState.load(checkpoint, part)
+    if state.offset > os.path.getsize(filename):
+        raise ValueError(
+            f"Checkpoint offset {state.offset} is past the end of {filename}; "
+            "the log was truncated or rotated"
+        )
+    with open(filename, "rb") as stream:
+        stream.seek(state.offset)
+        advance(state, parse_rotations(complete_lines(stream, state)))
+    state.save(checkpoint)
+    return state.zero_count
+
+
+def solve_from_file(
+    filename: str, checkpoint: str | None = None, workers: int | None = None
+) -> int:
+    """Solve by streaming input from a file ('-' reads stdin)."""
+    if workers is not None:
+        return solve_parallel(filename, workers)
+    if checkpoint is not None:
+        return resume_from_file(filename, checkpoint)
+    with open_input(filename) as stream:
+        return solve_moves(parse_rotations(stream))
+
+
+def chunk_ranges(filename: str, chunks: int) -> list[tuple[int, int]]:
+    """Split a file into up to `chunks` contiguous byte ranges."""
+    size = os.path.getsize(filename)
+    step = max(1, -(-size // chunks))
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def read_chunk_lines(stream: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """
+    Yield the lines whose first byte lies in [start, end).
+
+    Every line belongs to exactly one chunk, so adjacent byte ranges never
+    split or duplicate an instruction.
+    """
+    if start > 0:
+        # Skip the line that started in the previous chunk (if any)
+        stream.seek(start - 1)
+        stream.readline()
+    while stream.tell() < end:
+        line = stream.readline()
+        if not line:
+            break
+        yield line
+
+
+def summarize_chunk(
+    filename: str,
+    start: int,
+    end: int,
+    summarize: Callable[[Iterable[tuple[str, int]]], DialSegment],
+) -> DialSegment:
+    """Worker: summarize the rotations in one byte range of a file."""
+    with open(filename, "rb") as stream:
+        return summarize(parse_rotations(read_chunk_lines(stream, start, end)))
+
+
+def solve_parallel(
+    filename: str,
+    workers: int,
+    summarize: Callable[[Iterable[tuple[str, int]]], DialSegment] = summarize_segment,
+) -> int:
+    """
+    Map-reduce solver: summarize byte ranges in a process pool, combine in order.
+
+    Args:
+        filename: Rotation log to read
+        workers: Number of worker processes (and chunks)
+        summarize: Per-chunk summary function for the part being solved
+
+    Returns:
+        Zero count for the whole log, starting from position 50
+    """
+    if filename == "-":
+        raise ValueError("Parallel mode needs a seekable input file, not stdin")
+    if workers < 1:
+        raise ValueError(f"Parallel mode needs at least 1 worker, got {workers}")
+
+    ranges = chunk_ranges(filename, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        segments = pool.map(
+            summarize_chunk,
+            repeat(filename),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+            repeat(summarize),
+        )
+        total = DialSegment()
+        for segment in segments:
+            total = total.combine(segment)
+    return total.hits[50]
+
+
+def get_option(argv: list[str], name: str) -> str | None:
+    """Return the value following a '--name VALUE' argument, if given."""
+    if name not in argv:
+        return None
+    i = argv.index(name)
+    if i + 1 >= len(argv):
+        raise ValueError(f"{name} needs a value")
+    return argv[i + 1]
+
+
+def parse_workers_arg(argv: list[str]) -> int | None:
+    """
+    Parse '--workers [N]' from the command line.
+
+    Returns:
+        Worker count (os.cpu_count() when N is omitted), or None for serial mode
+    """
+    if "--workers" not in argv:
+        return None
+    i = argv.index("--workers")
+    if i + 1 < len(argv) and argv[i + 1].isdigit():
+        return int(argv[i + 1])
+    return os.cpu_count() or 1
 
 
-def solve_from_file(filename: str) -> int:
-    """Solve using input from a file."""
-    with open(filename, "r") as f:
-        rotations = [line.strip() for line in f if line.strip()]
-    return solve(rotations)
+def positional_args(argv: list[str]) -> list[str]:
+    """Return arguments that are neither flags nor values of options."""
+    args = []
+    for i, arg in enumerate(argv[1:], start=1):
+        if arg.startswith("--") or argv[i - 1] == "--checkpoint":
+            continue
+        # parse_workers_arg takes a digit string right after --workers as N
+        if argv[i - 1] == "--workers" and arg.isdigit():
+            continue
+        args.append(arg)
+    return args
 
 
 def main():
     """Main entry point - solve puzzle."""
     # Parse command line arguments
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    checkpoint = get_option(sys.argv, "--checkpoint")
+    workers = parse_workers_arg(sys.argv)
+    args = positional_args(sys.argv)
+    input_file = args[0] if args else "input.txt"
 
     # Solve the actual puzzle
-    answer = solve_from_file(input_file)
+    answer = solve_from_file(
+        input_file,
+        checkpoint=checkpoint,
+        workers=workers,
+    )
     print(answer)
 
 
@@ -12,12 +12,184 @@ Task: Count how many times the dial points at 0 DURING OR AFTER rotations.
 """
 
 import sys
+from collections.abc import Iterable
+
+from part_1 import (
+    DialSegment,
+    DialState,
+    get_option,
+    open_input,
+    parse_rotation_strings,
+    parse_rotations,
+    parse_workers_arg,
+    positional_args,
+    resume_from_file,
+    rotation_deltas,
+    solve_parallel,
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python fold
+    np = None
+
+
+def count_zero_hits(position: int, direction: str, distance: int) -> int:
+    """
+    Count clicks that land on 0 during a single rotation, in O(1).
+
+    Going right from `position`, the clicks that hit 0 are the multiples of 100
+    in (position, position + distance], so the count is a floor division.
+    Going left is the mirror image: measure from the reflected position
+    (100 - position) % 100, which is how far away 0 is when moving right.
+
+    Args:
+        position: Current dial position (0-99)
+        direction: 'L' or 'R'
+        distance: Number of clicks
+
+    Returns:
+        Number of clicks in this rotation that point the dial at 0
+    """
+    if direction == "L":
+        return ((100 - position) % 100 + distance) // 100
+    return (position + distance) // 100
+
+
+def advance_state(
+    state: DialState, moves: Iterable[tuple[str, int]], debug: bool = False
+):
+    """
+    Fold moves into a dial state, counting every click that lands on 0.
+
+    Uses the closed-form `count_zero_hits`, so runtime scales with the number
+    of rotations rather than the total number of clicks.
+
+    Args:
+        state: Dial state to update in place
+        moves: Iterable of (direction, distance) tuples
+        debug: If True, print detailed trace
+    """
+    position = state.position
+    zero_count = state.zero_count
+
+    for direction, distance in moves:
+        rotation_zeros = count_zero_hits(position, direction, distance)
+
+        if direction == "L":
+            new_position = (position - distance) % 100
+        else:  # direction == 'R'
+            new_position = (position + distance) % 100
+
+        zero_count += rotation_zeros
+
+        if debug:
+            print(
+                f"{direction}{distance}: {position} -> {new_position}, zeros during rotation: {rotation_zeros}"
+            )
+
+        position = new_position
+
+    state.position = position
+    state.zero_count = zero_count
+
+
+def solve_moves(moves: Iterable[tuple[str, int]], debug: bool = False) -> int:
+    """
+    Count ALL times the dial passes through 0, folding over parsed moves.
+
+    Args:
+        moves: Iterable of (direction, distance) tuples
+        debug: If True, print detailed trace
+
+    Returns:
+        Number of times the dial points at 0 during or after any rotation
+    """
+    state = DialState()
+
+    if debug:
+        print(f"Starting at position {state.position}")
+
+    advance_state(state, moves, debug=debug)
+
+    if debug:
+        print(f"\nTotal zeros: {state.zero_count}")
+
+    return state.zero_count
+
+
+def summarize_segment(moves: Iterable[tuple[str, int]]) -> DialSegment:
+    """
+    Summarize moves as a DialSegment in a single pass.
+
+    Track the unwrapped offset c from the start s. A rotation hits 0 once per
+    multiple of 100 crossed, which is a difference of terms floor((s + a) / 100)
+    (see `solve_numpy`). Each term is a//100 plus a step of 1 once s reaches
+    100 - a % 100, so a constant plus a difference array over s covers every
+    start position at once.
+    """
+    offset = 0
+    base = 0
+    steps = [0] * 101
+
+    def add(a: int, sign: int):
+        nonlocal base
+        base += sign * (a // 100)
+        steps[100 - a % 100] += sign
+
+    for direction, distance in moves:
+        if direction == "L":
+            add(offset - 1, 1)
+            offset -= distance
+            add(offset - 1, -1)
+        else:  # direction == 'R'
+            add(offset, -1)
+            offset += distance
+            add(offset, 1)
+
+    hits = []
+    running = base
+    for s in range(100):
+        running += steps[s]
+        hits.append(running)
+    return DialSegment(offset % 100, hits)
+
+
+def solve_numpy(rotations: list[str]) -> int:
+    """
+    Vectorized Part 2 over the unwrapped (never reduced mod 100) dial position.
+
+    A rotation from unwrapped position `before` to `after` hits 0 once per
+    multiple of 100 it crosses: (before, after] going right, [after, before)
+    going left. Both counts are differences of floor divisions.
+
+    Args:
+        rotations: List of rotation instructions (e.g., ['L68', 'R48', ...])
+
+    Returns:
+        Number of times the dial points at 0 during or after any rotation
+    """
+    deltas = rotation_deltas(rotations)
+    if deltas is None:
+        # Too large for int64: fold with Python ints instead
+        return solve_moves(parse_rotation_strings(rotations))
+    after = 50 + np.cumsum(deltas)
+    before = after - deltas
+    hits = np.where(
+        deltas > 0,
+        after // 100 - before // 100,
+        (before - 1) // 100 - (after - 1) // 100,
+    )
+    return int(hits.sum())
 
 
 def solve(rotations: list[str], debug: bool = False) -> int:
     """
     Solve Part 2: Count ALL times dial passes through 0 (during or after rotation).
 
+    Uses the NumPy backend when it is installed (and not debugging), pure
+    Python otherwise.
+
     Args:
         rotations: List of rotation instructions (e.g., ['L68', 'R48', ...])
         debug: If True, print detailed trace
@@ -25,68 +197,128 @@ def solve(rotations: list[str], debug: bool = False) -> int:
     Returns:
         Number of times the dial points at 0 during or after any rotation
     """
+    if np is not None and not debug:
+        return solve_numpy(rotations)
+    return solve_moves(parse_rotation_strings(rotations), debug=debug)
+
+
+def solve_both(moves: Iterable[tuple[str, int]]) -> tuple[int, int]:
+    """
+    Compute the Part 1 and Part 2 answers in a single pass over the moves.
+
+    Args:
+        moves: Iterable of (direction, distance) tuples
+
+    Returns:
+        (zeros after rotations, zeros during or after rotations)
+    """
     position = 50  # Starting position
-    zero_count = 0
+    end_zeros = 0
+    all_zeros = 0
 
-    if debug:
-        print(f"Starting at position {position}")
+    for direction, distance in moves:
+        all_zeros += count_zero_hits(position, direction, distance)
+
+        if direction == "L":
+            position = (position - distance) % 100
+        else:  # direction == 'R'
+            position = (position + distance) % 100
+
+        if position == 0:
+            end_zeros += 1
+
+    return end_zeros, all_zeros
+
+
+def solve_reference(rotations: list[str]) -> int:
+    """
+    Reference Part 2 solver that simulates every single click.
+
+    Runtime is proportional to the total distance turned, so this is only
+    meant for cross-checking `solve` on small inputs.
+
+    Args:
+        rotations: List of rotation instructions (e.g., ['L68', 'R48', ...])
+
+    Returns:
+        Number of times the dial points at 0 during or after any rotation
+    """
+    position = 50  # Starting position
+    zero_count = 0
 
     for rotation in rotations:
         direction = rotation[0]  # 'L' or 'R'
         distance = int(rotation[1:])  # Number of clicks
 
-        # Count passes through 0 during this rotation
-        rotation_zeros = 0
-
         if direction == "L":
             # For each click going left, check if we hit 0
             for i in range(1, distance + 1):
-                new_pos = (position - i) % 100
-                if new_pos == 0:
-                    rotation_zeros += 1
+                if (position - i) % 100 == 0:
+                    zero_count += 1
 
-            new_position = (position - distance) % 100
+            position = (position - distance) % 100
 
         else:  # direction == 'R'
             # For each click going right, check if we hit 0
             for i in range(1, distance + 1):
-                new_pos = (position + i) % 100
-                if new_pos == 0:
-                    rotation_zeros += 1
+                if (position + i) % 100 == 0:
+                    zero_count += 1
 
-            new_position = (position + distance) % 100
-
-        zero_count += rotation_zeros
-
-        if debug:
-            print(
-                f"{rotation}: {position} -> {new_position}, zeros during rotation: {rotation_zeros}"
-            )
+            position = (position + distance) % 100
 
-        position = new_position
+    return zero_count
 
-    if debug:
-        print(f"\nTotal zeros: {zero_count}")
 
-    return zero_count
+def solve_from_file(
+    filename: str,
+    reference: bool = False,
+    checkpoint: str | None = None,
+    workers: int | None = None,
+) -> int:
+    """Solve by streaming input from a file ('-' reads stdin)."""
+    if workers is not None:
+        return solve_parallel(filename, workers, summarize=summarize_segment)
+    if checkpoint is not None:
+        return resume_from_file(
+            filename, checkpoint, advance=advance_state, part="part_2"
+        )
+    with open_input(filename) as stream:
+        if reference:
+            rotations = [f"{d}{n}" for d, n in parse_rotations(stream)]
+            return solve_reference(rotations)
+        return solve_moves(parse_rotations(stream))
 
 
-def solve_from_file(filename: str) -> int:
-    """Solve using input from a file."""
-    with open(filename, "r") as f:
-        rotations = [line.strip() for line in f if line.strip()]
-    return solve(rotations)
+def solve_both_from_file(filename: str) -> tuple[int, int]:
+    """Solve both parts with one streaming pass over a file ('-' reads stdin)."""
+    with open_input(filename) as stream:
+        return solve_both(parse_rotations(stream))
 
 
 def main():
     """Main entry point - solve puzzle."""
     # Parse command line arguments
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    checkpoint = get_option(sys.argv, "--checkpoint")
+    workers = parse_workers_arg(sys.argv)
+    args = positional_args(sys.argv)
+    input_file = args[0] if args else "input.txt"
     debug = "--debug" in sys.argv
+    reference = "--reference" in sys.argv
+
+    if "--both" in sys.argv:
+        # Print both answers from a single pass over the input
+        for answer in solve_both_from_file(input_file):
+            print(answer)
+        return
 
     # Solve the actual puzzle
     answer = (
-        solve_from_file(input_file)
+        solve_from_file(
+            input_file,
+            reference=reference,
+            checkpoint=checkpoint,
+            workers=workers,
+        )
         if not debug
         else solve(
             ["L68", "L30", "R48", "L5", "R60", "L55", "L1", "L99", "R14", "L82"],
@@ -3,9 +3,28 @@
 Tests for Day 1: Secret Entrance
 """
 
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import pairwise
+
+import part_1
+import part_2
+from part_1 import parse_rotation_strings, parse_rotations
 from part_1 import solve as solve_part1
+from part_2 import count_zero_hits, solve_both, solve_reference
 from part_2 import solve as solve_part2
 
+EXAMPLE = ["L68", "L30", "R48", "L5", "R60", "L55", "L1", "L99", "R14", "L82"]
+
+
+def random_rotations(rng: random.Random, count: int, max_distance: int) -> list[str]:
+    """Generate a random list of rotation instructions."""
+    return [f"{rng.choice('LR')}{rng.randint(0, max_distance)}" for _ in range(count)]
+
 
 def test_example_part1():
     """Test Part 1 with the example from the puzzle."""
@@ -73,6 +92,271 @@ def test_exact_wrap_part2():
     print("✓ Part 2: Exact wrap test passed")
 
 
+def test_count_zero_hits_part2():
+    """Test the closed-form zero counter on boundary cases (Part 2)."""
+    assert count_zero_hits(0, "L", 0) == 0, "No clicks, no zeros"
+    assert count_zero_hits(0, "L", 99) == 0, "L99 from 0 stops at 1"
+    assert count_zero_hits(0, "L", 100) == 1, "L100 from 0 returns to 0"
+    assert count_zero_hits(0, "R", 100) == 1, "R100 from 0 returns to 0"
+    assert count_zero_hits(5, "L", 5) == 1, "L5 from 5 ends at 0"
+    assert count_zero_hits(5, "L", 4) == 0, "L4 from 5 stops at 1"
+    assert count_zero_hits(5, "L", 105) == 2, "L105 from 5 hits 0 twice"
+    assert count_zero_hits(95, "R", 5) == 1, "R5 from 95 ends at 0"
+    assert count_zero_hits(95, "R", 4) == 0, "R4 from 95 stops at 99"
+    assert count_zero_hits(50, "R", 1000) == 10, "R1000 from 50 hits 0 ten times"
+    print("✓ Part 2: count_zero_hits boundary test passed")
+
+
+def test_matches_reference_part2():
+    """Cross-check the closed-form solver against click simulation (Part 2)."""
+    rng = random.Random(2025)
+    for _ in range(200):
+        rotations = random_rotations(rng, rng.randint(1, 30), 450)
+        expected = solve_reference(rotations)
+        result = solve_part2(rotations)
+        assert result == expected, f"{rotations}: expected {expected}, got {result}"
+    print("✓ Part 2: Closed-form solver matches click simulation on random inputs")
+
+
+def test_parse_rotations_stream():
+    """Test streaming parser on a binary stream with blank lines and CRLF."""
+    stream = io.BytesIO(b"L68\r\n\nR48\n  L5  \nR1000")
+    moves = list(parse_rotations(stream))
+    expected = [("L", 68), ("R", 48), ("L", 5), ("R", 1000)]
+    assert moves == expected, f"Expected {expected}, got {moves}"
+    print("✓ Streaming parser test passed")
+
+
+def test_solve_both_single_pass():
+    """Test that one parse pass yields both answers."""
+    stream = io.BytesIO("\n".join(EXAMPLE).encode())
+    result = solve_both(parse_rotations(stream))
+    assert result == (3, 6), f"Expected (3, 6), got {result}"
+    print("✓ Single-pass solver test passed: (3, 6)")
+
+
+def test_numpy_backend():
+    """Cross-check the NumPy backend against the pure-Python fold."""
+    if part_1.np is None:
+        print("- NumPy not installed, skipping NumPy backend test")
+        return
+    rng = random.Random(7)
+    for _ in range(100):
+        rotations = random_rotations(rng, rng.randint(0, 50), 450)
+        moves = list(parse_rotation_strings(rotations))
+        expected = (part_1.solve_moves(moves), part_2.solve_moves(moves))
+        result = (part_1.solve_numpy(rotations), part_2.solve_numpy(rotations))
+        assert result == expected, f"{rotations}: expected {expected}, got {result}"
+
+    # Distances or running sums past int64 fall back to Python ints
+    overflow_cases = [
+        ["R" + "9" * 25, "L3"],
+        ["R" + "9" * 19],
+        ["R" + "9" * 18] * 20,
+        ["L" + "9" * 18, "L" + "9" * 18, "R1"],
+    ]
+    for rotations in overflow_cases:
+        moves = list(parse_rotation_strings(rotations))
+        expected = (part_1.solve_moves(moves), part_2.solve_moves(moves))
+        result = (part_1.solve_numpy(rotations), part_2.solve_numpy(rotations))
+        assert result == expected, f"{rotations}: expected {expected}, got {result}"
+    result = part_2.solve(["R" + "9" * 25, "L3"])
+    assert result == 10**23, f"Expected 10**23, got {result}"
+    print("✓ NumPy backend matches pure-Python fold on random and huge inputs")
+
+
+def benchmark_numpy_backend(count: int = 10_000_000):
+    """Time the pure-Python fold against the NumPy backend on random input."""
+    if part_1.np is None:
+        print("NumPy not installed, nothing to benchmark")
+        return
+    rng = random.Random(0)
+    rotations = random_rotations(rng, count, 1_000_000)
+    print(f"Benchmarking Day 1 on {count:,} rotations...")
+    for name, python_solve, numpy_solve in [
+        ("Part 1", part_1.solve_moves, part_1.solve_numpy),
+        ("Part 2", part_2.solve_moves, part_2.solve_numpy),
+    ]:
+        start = time.perf_counter()
+        expected = python_solve(parse_rotation_strings(rotations))
+        python_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = numpy_solve(rotations)
+        numpy_time = time.perf_counter() - start
+
+        assert result == expected, f"{name}: expected {expected}, got {result}"
+        print(
+            f"{name}: python {python_time:.2f}s, numpy {numpy_time:.2f}s "
+            f"({python_time / numpy_time:.1f}x speedup)"
+        )
+
+
+def test_checkpoint_resume():
+    """Test resuming from a checkpoint after lines are appended to the log."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "rotations.txt")
+        checkpoint_1 = os.path.join(tmp, "part_1.json")
+        checkpoint_2 = os.path.join(tmp, "part_2.json")
+
+        with open(log, "w") as f:
+            f.write("\n".join(EXAMPLE[:4]) + "\n")
+        first = (
+            part_1.solve_from_file(log, checkpoint=checkpoint_1),
+            part_2.solve_from_file(log, checkpoint=checkpoint_2),
+        )
+        expected = (solve_part1(EXAMPLE[:4]), solve_part2(EXAMPLE[:4]))
+        assert first == expected, f"Expected {expected}, got {first}"
+
+        with open(log, "a") as f:
+            f.write("\n".join(EXAMPLE[4:]) + "\n")
+        state = part_1.DialState.load(checkpoint_1)
+        assert state.offset == len("\n".join(EXAMPLE[:4])) + 1, "Offset mismatch"
+
+        second = (
+            part_1.solve_from_file(log, checkpoint=checkpoint_1),
+            part_2.solve_from_file(log, checkpoint=checkpoint_2),
+        )
+        assert second == (3, 6), f"Expected (3, 6), got {second}"
+
+        # Nothing appended: resuming again is a no-op
+        third = part_2.solve_from_file(log, checkpoint=checkpoint_2)
+        assert third == 6, f"Expected 6, got {third}"
+
+        # A checkpoint written by the other part is rejected
+        try:
+            part_2.solve_from_file(log, checkpoint=checkpoint_1)
+            raise AssertionError("Expected a part mismatch to be rejected")
+        except ValueError:
+            pass
+
+        # So is an offset past the end of a truncated log
+        with open(log, "w") as f:
+            f.write("\n".join(EXAMPLE[:2]) + "\n")
+        try:
+            part_1.solve_from_file(log, checkpoint=checkpoint_1)
+            raise AssertionError("Expected a truncated log to be rejected")
+        except ValueError:
+            pass
+    print("✓ Checkpoint resume test passed: (3, 6)")
+
+
+def test_checkpoint_partial_line():
+    """Test resuming while the last line of the log is only half written."""
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "rotations.txt")
+        checkpoint_1 = os.path.join(tmp, "part_1.json")
+        checkpoint_2 = os.path.join(tmp, "part_2.json")
+        chunks = ["R50\nL6", "0\nR10\nL", "10\nR1", "0", "0\n"]
+        rotations = "".join(chunks).split()
+
+        with open(log, "w") as f:
+            pass
+        for i, chunk in enumerate(chunks, start=1):
+            with open(log, "a") as f:
+                f.write(chunk)
+            complete = "".join(chunks[:i]).split("\n")[:-1]
+            result = (
+                part_1.solve_from_file(log, checkpoint=checkpoint_1),
+                part_2.solve_from_file(log, checkpoint=checkpoint_2),
+            )
+            expected = (solve_part1(complete), solve_part2(complete))
+            assert result == expected, (
+                f"After {i} writes: expected {expected}, got {result}"
+            )
+
+        expected = (solve_part1(rotations), solve_part2(rotations))
+        assert result == expected, f"Expected {expected}, got {result}"
+        state = part_1.DialState.load(checkpoint_1)
+        assert state.offset == os.path.getsize(log), "Offset should reach the end"
+    print(f"✓ Partial-line resume test passed: {result}")
+
+
+def test_segment_summaries():
+    """Test that segment summaries match the fold for every start position."""
+    rng = random.Random(5)
+    for _ in range(50):
+        moves = list(parse_rotation_strings(random_rotations(rng, 20, 450)))
+        for part in (part_1, part_2):
+            segment = part.summarize_segment(moves)
+            for start in range(100):
+                state = part_1.DialState(position=start)
+                part.advance_state(state, moves)
+                assert segment.hits[start] == state.zero_count, "Hit count mismatch"
+                assert (start + segment.net) % 100 == state.position, "Net mismatch"
+    print("✓ Segment summaries match the fold for all start positions")
+
+
+def test_segment_combine():
+    """Test that combining chunk summaries in order equals one summary."""
+    rng = random.Random(11)
+    for _ in range(50):
+        moves = list(parse_rotation_strings(random_rotations(rng, 40, 450)))
+        cuts = sorted(rng.sample(range(len(moves) + 1), 3))
+        bounds = [0, *cuts, len(moves)]
+        for part in (part_1, part_2):
+            combined = part_1.DialSegment()
+            for lo, hi in pairwise(bounds):
+                combined = combined.combine(part.summarize_segment(moves[lo:hi]))
+            whole = part.summarize_segment(moves)
+            assert combined.hits == whole.hits, "Combined hits mismatch"
+            assert combined.net == whole.net, "Combined net mismatch"
+    print("✓ Combining chunk summaries matches a single summary")
+
+
+def test_solve_parallel():
+    """Test the process-pool solver on chunked byte ranges."""
+    rng = random.Random(3)
+    rotations = random_rotations(rng, 500, 450)
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "rotations.txt")
+        with open(log, "w") as f:
+            f.write("\n".join(rotations) + "\n")
+
+        # Every line lands in exactly one chunk, whatever the chunk count
+        for chunks in (1, 3, 7, 64):
+            lines = []
+            with open(log, "rb") as stream:
+                for start, end in part_1.chunk_ranges(log, chunks):
+                    lines.extend(part_1.read_chunk_lines(stream, start, end))
+            assert [line.strip().decode() for line in lines] == rotations, (
+                f"Chunk split with {chunks} chunks lost or duplicated lines"
+            )
+
+        expected = (solve_part1(rotations), solve_part2(rotations))
+        result = (
+            part_1.solve_from_file(log, workers=3),
+            part_2.solve_from_file(log, workers=3),
+        )
+        assert result == expected, f"Expected {expected}, got {result}"
+
+        # A worker count below 1 is rejected up front
+        try:
+            part_1.solve_from_file(log, workers=0)
+            raise AssertionError("Expected workers=0 to be rejected")
+        except ValueError:
+            pass
+    print(f"✓ Parallel solver test passed: {result}")
+
+
+def test_workers_arg():
+    """Test '--workers [N]' parsing and that positionals survive it."""
+    cpus = os.cpu_count() or 1
+    cases = [
+        (["part_1.py", "in.txt"], None, ["in.txt"]),
+        (["part_1.py", "in.txt", "--workers", "4"], 4, ["in.txt"]),
+        (["part_1.py", "--workers", "4", "in.txt"], 4, ["in.txt"]),
+        (["part_1.py", "in.txt", "--workers"], cpus, ["in.txt"]),
+        (["part_1.py", "--workers", "in.txt"], cpus, ["in.txt"]),
+        (["part_1.py", "--workers", "0", "in.txt"], 0, ["in.txt"]),
+        (["part_1.py", "--checkpoint", "s.json", "4", "--workers"], cpus, ["4"]),
+    ]
+    for argv, workers, args in cases:
+        assert part_1.parse_workers_arg(argv) == workers, f"{argv}: workers"
+        assert part_1.positional_args(argv) == args, f"{argv}: positional args"
+    print("✓ --workers parsing test passed")
+
+
 def run_tests():
     """Run all tests."""
     print("Running Day 1 tests...\n")
@@ -85,8 +369,26 @@ def run_tests():
     test_pass_through_during_rotation_part2()
     test_no_zeros_part2()
     test_exact_wrap_part2()
+    test_count_zero_hits_part2()
+    test_matches_reference_part2()
+    print("\n=== Streaming Tests ===")
+    test_parse_rotations_stream()
+    test_solve_both_single_pass()
+    test_checkpoint_resume()
+    test_checkpoint_partial_line()
+    print("\n=== Parallel Tests ===")
+    test_segment_summaries()
+    test_segment_combine()
+    test_solve_parallel()
+    test_workers_arg()
+    print("\n=== NumPy Backend Tests ===")
+    test_numpy_backend()
     print("\n✓ All tests passed!")
 
 
 if __name__ == "__main__":
-    run_tests()
+    if "--benchmark" in sys.argv:
+        args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+        benchmark_numpy_backend(int(args[0]) if args else 10_000_000)
+    else:
+        run_tests()
@@ -15,6 +15,128 @@ Examples of invalid IDs:
 """
 
 import sys
+from collections.abc import Callable, Iterator
+from typing import TextIO
+
+# Predicate on (ID length, primitive repeat count) selecting which IDs count
+RepeatPredicate = Callable[[int, int], bool]
+
+
+def divisors(n: int) -> list[int]:
+    """Return the divisors of n in ascending order."""
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+
+def mobius(n: int) -> int:
+    """Möbius function: 0 if n has a squared prime factor, else (-1)^(#primes)."""
+    result = 1
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:
+                return 0
+            result = -result
+        factor += 1
+    if n > 1:
+        result = -result
+    return result
+
+
+def repeated_block_stats(
+    start: int, end: int, length: int, repetitions: int
+) -> tuple[int, int]:
+    """
+    Count and sum the `length`-digit numbers in [start, end] that consist of a
+    block repeated `repetitions` times.
+
+    Such a number is block * (10^length - 1) / (10^(length/repetitions) - 1)
+    for a contiguous run of blocks, so the sum is an arithmetic series.
+    """
+    pattern_len = length // repetitions
+    multiplier = (10**length - 1) // (10**pattern_len - 1)
+
+    # Blocks have exactly pattern_len digits (no leading zero)
+    lo = max(10 ** (pattern_len - 1), -(-start // multiplier))
+    hi = min(10**pattern_len - 1, end // multiplier)
+    if lo > hi:
+        return 0, 0
+    count = hi - lo + 1
+    return count, multiplier * (lo + hi) * count // 2
+
+
+def repeated_id_stats(
+    start: int, end: int, predicate: RepeatPredicate
+) -> tuple[int, int]:
+    """
+    Count and sum the IDs in [start, end] selected by a repeat predicate.
+
+    Every ID has a primitive repeat count r: the largest r such that it is
+    one block repeated r times (r = 1 for IDs with no repetition). The ID is
+    a block repeated k times exactly when k divides r. `predicate(length, r)`
+    decides which IDs count, so product rules only differ in the predicate.
+
+    For each length, the IDs repeated m times (`repeated_block_stats`) are
+    those whose r is a multiple of m, so Möbius inversion over the divisors
+    of the length isolates each exact r without iterating over IDs.
+
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+        predicate: Function of (ID length, primitive repeat count)
+
+    Returns:
+        (count, sum) of the selected IDs between start and end
+    """
+    total_count = 0
+    total_sum = 0
+
+    for length in range(len(str(start)), len(str(end)) + 1):
+        length_divisors = divisors(length)
+        for repeats in length_divisors:
+            if not predicate(length, repeats):
+                continue
+
+            # IDs whose primitive repeat count is exactly `repeats`
+            for multiple in length_divisors:
+                if multiple % repeats != 0:
+                    continue
+                sign = mobius(multiple // repeats)
+                if sign == 0:
+                    continue
+                count, block_sum = repeated_block_stats(start, end, length, multiple)
+                total_count += sign * count
+                total_sum += sign * block_sum
+
+    return total_count, total_sum
+
+
+def repeated_exactly(k: int) -> RepeatPredicate:
+    """Predicate for IDs that are a block repeated exactly k times."""
+    return lambda length, repeats: repeats % k == 0
+
+
+def repeated_at_least(k: int) -> RepeatPredicate:
+    """Predicate for IDs that are a block repeated k or more times."""
+    return lambda length, repeats: repeats >= k
+
+
+def repeated_with_periods(periods: set[int]) -> RepeatPredicate:
+    """Predicate for IDs that repeat with one of the given block lengths."""
+
+    def predicate(length: int, repeats: int) -> bool:
+        # The ID repeats with block length p iff p is a proper divisor of the
+        # length and a multiple of the primitive block length
+        primitive_len = length // repeats
+        return any(
+            p < length and length % p == 0 and p % primitive_len == 0 for p in periods
+        )
+
+    return predicate
+
+
+# Part 1 rule: a sequence of digits repeated exactly twice
+is_doubled = repeated_exactly(2)
 
 
 def is_invalid_id(num: int) -> bool:
@@ -30,48 +152,176 @@ def is_invalid_id(num: int) -> bool:
     Returns:
         True if the number is an invalid product ID, False otherwise
     """
-    num_str = str(num)
-    length = len(num_str)
+    count, _ = repeated_id_stats(num, num, is_doubled)
+    return count == 1
 
-    # Must have even length to be repeatable
-    if length % 2 != 0:
-        return False
 
-    # Split in half and check if both halves are identical
-    half_len = length // 2
-    first_half = num_str[:half_len]
-    second_half = num_str[half_len:]
+def generate_invalid_ids(start: int, end: int) -> Iterator[int]:
+    """
+    Generate the invalid product IDs in [start, end] in ascending order.
+
+    A doubled ID with half-length h is pattern * (10^h + 1), so instead of
+    testing every number we walk the patterns whose product lands in range.
+    Cost scales with the number of invalid IDs, not the width of the range.
 
-    # Check if halves match and first half doesn't start with '0' (leading zero check)
-    if first_half == second_half and first_half[0] != "0":
-        return True
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+
+    Yields:
+        Invalid product IDs between start and end
+    """
+    for length in range(len(str(start)), len(str(end)) + 1):
+        # Must have even length to be repeatable
+        if length % 2 != 0:
+            continue
 
-    return False
+        half_len = length // 2
+        multiplier = 10**half_len + 1
 
+        # Patterns have exactly half_len digits (no leading zero)
+        lo = max(10 ** (half_len - 1), -(-start // multiplier))
+        hi = min(10**half_len - 1, end // multiplier)
+        for pattern in range(lo, hi + 1):
+            yield pattern * multiplier
 
-def solve(ranges: list[str]) -> int:
+
+def sum_invalid_ids(start: int, end: int) -> int:
+    """
+    Sum the invalid product IDs in [start, end] without enumerating them.
+
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+
+    Returns:
+        Sum of the invalid product IDs between start and end
+    """
+    _, total_sum = repeated_id_stats(start, end, is_doubled)
+    return total_sum
+
+
+class InvalidIdIndex:
+    """
+    Range-sum index over the IDs selected by a repeat predicate.
+
+    `length_sums[n]` is the sum of the selected IDs with at most n digits,
+    computed in closed form the first time a query reaches length n and
+    then kept. A query is prefix(end) - prefix(start - 1), and a prefix only
+    needs the cached total below its own digit length plus one closed-form
+    partial sum, so queries stay polylogarithmic and the cache holds one
+    integer per digit length, whatever the size of the IDs.
+    """
+
+    def __init__(self, predicate: RepeatPredicate):
+        self.predicate = predicate
+        self.length_sums = [0]  # digit length -> sum of selected IDs up to it
+
+    def length_sum(self, length: int) -> int:
+        """Return the sum of the selected IDs with at most `length` digits."""
+        while len(self.length_sums) <= length:
+            n = len(self.length_sums)
+            _, total_sum = repeated_id_stats(10 ** (n - 1), 10**n - 1, self.predicate)
+            self.length_sums.append(self.length_sums[-1] + total_sum)
+        return self.length_sums[length]
+
+    def prefix_sum(self, x: int) -> int:
+        """Sum the selected IDs in [1, x]."""
+        if x < 1:
+            return 0
+        length = len(str(x))
+        _, partial_sum = repeated_id_stats(10 ** (length - 1), x, self.predicate)
+        return self.length_sum(length - 1) + partial_sum
+
+    def range_sum(self, start: int, end: int) -> int:
+        """Sum the selected IDs in [start, end] using the cached length totals."""
+        if start > end:
+            return 0
+        return self.prefix_sum(end) - self.prefix_sum(start - 1)
+
+
+def build_index() -> InvalidIdIndex:
+    """Create a reusable Part 1 query index."""
+    return InvalidIdIndex(is_doubled)
+
+
+def parse_ranges(ranges: list[str]) -> list[tuple[int, int]]:
+    """Parse "start-end" strings into (start, end) tuples."""
+    return [tuple(map(int, range_str.split("-"))) for range_str in ranges]
+
+
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Sort ranges and merge overlapping or adjacent ones.
+
+    Args:
+        ranges: List of inclusive (start, end) tuples
+
+    Returns:
+        Disjoint, sorted list of inclusive (start, end) tuples
+    """
+    merged_ranges = []
+    for start, end in sorted(ranges):
+        if merged_ranges and start <= merged_ranges[-1][1] + 1:
+            # Overlapping or adjacent - extend the last range
+            merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], end))
+        else:
+            # Non-overlapping - add as new range
+            merged_ranges.append((start, end))
+    return merged_ranges
+
+
+def solve(ranges: list[str], index: InvalidIdIndex | None = None) -> int:
     """
     Find all invalid product IDs in the given ranges and return their sum.
 
+    Overlapping ranges are merged first so no ID is counted twice.
+
     Args:
         ranges: List of range strings in format "start-end"
+        index: Optional prebuilt query index that reuses cached per-length
+            totals across calls
 
     Returns:
         Sum of all invalid product IDs
     """
     total_sum = 0
 
-    for range_str in ranges:
-        start, end = map(int, range_str.split("-"))
-
-        # Check each number in the range
-        for num in range(start, end + 1):
-            if is_invalid_id(num):
-                total_sum += num
+    for start, end in merge_ranges(parse_ranges(ranges)):
+        if index is not None:
+            total_sum += index.range_sum(start, end)
+        else:
+            # Sum each digit length's invalid IDs as an arithmetic series
+            total_sum += sum_invalid_ids(start, end)
 
     return total_sum
 
 
+def serve(
+    solve_batch: Callable[[list[str], InvalidIdIndex], int],
+    index: InvalidIdIndex,
+    instream: TextIO,
+    outstream: TextIO,
+):
+    """
+    Answer range-sum queries line by line until the input stream closes.
+
+    Each non-blank line is a batch in input-file format ("start-end", comma
+    separated) and gets exactly one response line: the sum, or an error
+    message for a malformed query. The index stays warm between queries.
+    """
+    for line in instream:
+        line = line.strip()
+        if not line:
+            continue
+        ranges = [r.strip() for r in line.split(",") if r.strip()]
+        try:
+            answer = solve_batch(ranges, index)
+        except ValueError:
+            answer = f"error: invalid query {line!r}"
+        print(answer, file=outstream, flush=True)
+
+
 def solve_from_file(filename: str) -> int:
     """Solve using input from a file."""
     with open(filename, "r") as f:
@@ -83,6 +333,11 @@ def solve_from_file(filename: str) -> int:
 
 def main():
     """Main entry point - solve puzzle."""
+    # Long-lived query mode: read batches from stdin, write sums to stdout
+    if "--serve" in sys.argv:
+        serve(solve, build_index(), sys.stdin, sys.stdout)
+        return
+
     # Parse command line arguments
     input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
 
@@ -16,6 +16,19 @@ Examples of invalid IDs:
 """
 
 import sys
+from collections.abc import Iterator
+
+from part_1 import (
+    InvalidIdIndex,
+    merge_ranges,
+    parse_ranges,
+    repeated_at_least,
+    repeated_id_stats,
+    serve,
+)
+
+# Part 2 rule: a sequence of digits repeated at least twice
+is_repeated = repeated_at_least(2)
 
 
 def is_invalid_id(num: int) -> bool:
@@ -31,47 +44,86 @@ def is_invalid_id(num: int) -> bool:
     Returns:
         True if the number is an invalid product ID, False otherwise
     """
-    num_str = str(num)
-    length = len(num_str)
-
-    # Try all possible pattern lengths from 1 to length//2
-    # A pattern must repeat at least twice, so max pattern length is length//2
-    for pattern_len in range(1, length // 2 + 1):
-        # Check if the number can be divided into this pattern length
-        if length % pattern_len == 0:
-            pattern = num_str[:pattern_len]
-
-            # Check for leading zero
-            if pattern[0] == "0":
+    count, _ = repeated_id_stats(num, num, is_repeated)
+    return count == 1
+
+
+def generate_invalid_ids(start: int, end: int) -> Iterator[int]:
+    """
+    Generate the invalid product IDs in [start, end] in ascending order.
+
+    A pattern of length p repeated k times is pattern * (10^(p*k) - 1) / (10^p - 1),
+    so for each total length and each pattern length dividing it we walk the
+    patterns whose product lands in range. IDs reachable from several pattern
+    lengths (e.g. 1111 = 1 x 4 = 11 x 2) are deduplicated per total length.
+
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
+
+    Yields:
+        Invalid product IDs between start and end
+    """
+    for length in range(len(str(start)), len(str(end)) + 1):
+        invalid_ids = set()
+
+        # A pattern must repeat at least twice, so max pattern length is length//2
+        for pattern_len in range(1, length // 2 + 1):
+            if length % pattern_len != 0:
                 continue
 
-            # Check if the entire string is made of this pattern repeated
-            num_repetitions = length // pattern_len
-            if pattern * num_repetitions == num_str and num_repetitions >= 2:
-                return True
+            multiplier = (10**length - 1) // (10**pattern_len - 1)
+
+            # Patterns have exactly pattern_len digits (no leading zero)
+            lo = max(10 ** (pattern_len - 1), -(-start // multiplier))
+            hi = min(10**pattern_len - 1, end // multiplier)
+            invalid_ids.update(pattern * multiplier for pattern in range(lo, hi + 1))
+
+        yield from sorted(invalid_ids)
 
-    return False
 
+def sum_invalid_ids(start: int, end: int) -> int:
+    """
+    Sum the invalid product IDs in [start, end] without enumerating them.
+
+    Args:
+        start: First ID of the range (inclusive)
+        end: Last ID of the range (inclusive)
 
-def solve(ranges: list[str]) -> int:
+    Returns:
+        Sum of the invalid product IDs between start and end
+    """
+    _, total_sum = repeated_id_stats(start, end, is_repeated)
+    return total_sum
+
+
+def build_index() -> InvalidIdIndex:
+    """Create a reusable Part 2 query index."""
+    return InvalidIdIndex(is_repeated)
+
+
+def solve(ranges: list[str], index: InvalidIdIndex | None = None) -> int:
     """
     Find all invalid product IDs in the given ranges and return their sum.
 
+    Overlapping ranges are merged first so no ID is counted twice.
+
     Args:
         ranges: List of range strings in format "start-end"
+        index: Optional prebuilt query index that reuses cached per-length
+            totals across calls
 
     Returns:
         Sum of all invalid product IDs
     """
     total_sum = 0
 
-    for range_str in ranges:
-        start, end = map(int, range_str.split("-"))
-
-        # Check each number in the range
-        for num in range(start, end + 1):
-            if is_invalid_id(num):
-                total_sum += num
+    for start, end in merge_ranges(parse_ranges(ranges)):
+        if index is not None:
+            total_sum += index.range_sum(start, end)
+        else:
+            # Sum each digit length's invalid IDs in closed form
+            total_sum += sum_invalid_ids(start, end)
 
     return total_sum
 
@@ -87,6 +139,11 @@ def solve_from_file(filename: str) -> int:
 
 def main():
     """Main entry point - solve puzzle."""
+    # Long-lived query mode: read batches from stdin, write sums to stdout
+    if "--serve" in sys.argv:
+        serve(solve, build_index(), sys.stdin, sys.stdout)
+        return
+
     # Parse command line arguments
     input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
 
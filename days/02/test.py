@@ -3,8 +3,71 @@
 Tests for Day 2: Gift Shop
 """
 
-from part_1 import solve as solve_part1, is_invalid_id
-from part_2 import solve as solve_part2, is_invalid_id as is_invalid_id_part2
+import os
+import random
+import subprocess
+import sys
+import time
+
+from part_1 import (
+    solve as solve_part1,
+    is_invalid_id,
+    build_index,
+    generate_invalid_ids,
+    merge_ranges,
+    repeated_at_least,
+    repeated_exactly,
+    repeated_id_stats,
+    repeated_with_periods,
+    sum_invalid_ids,
+)
+from part_2 import (
+    solve as solve_part2,
+    is_invalid_id as is_invalid_id_part2,
+    build_index as build_index_part2,
+    generate_invalid_ids as generate_invalid_ids_part2,
+    sum_invalid_ids as sum_invalid_ids_part2,
+)
+
+
+def is_invalid_id_scan(num: int) -> bool:
+    """Oracle for Part 1: string check that the two halves are identical."""
+    num_str = str(num)
+    half_len = len(num_str) // 2
+    return len(num_str) % 2 == 0 and num_str[:half_len] == num_str[half_len:]
+
+
+def is_invalid_id_scan_part2(num: int) -> bool:
+    """Oracle for Part 2: string check for any pattern repeated 2+ times."""
+    num_str = str(num)
+    length = len(num_str)
+    return any(
+        length % pattern_len == 0
+        and num_str[:pattern_len] * (length // pattern_len) == num_str
+        for pattern_len in range(1, length // 2 + 1)
+    )
+
+
+def primitive_repeats_scan(num: int) -> int:
+    """Oracle: the largest r such that num is one block repeated r times."""
+    num_str = str(num)
+    length = len(num_str)
+    for pattern_len in range(1, length + 1):
+        repeats, remainder = divmod(length, pattern_len)
+        if remainder == 0 and num_str[:pattern_len] * repeats == num_str:
+            return repeats
+    return 1
+
+
+def random_ranges(
+    rng: random.Random, count: int, max_digits: int
+) -> list[tuple[int, int]]:
+    """Generate random (start, end) ranges spanning several digit lengths."""
+    ranges = []
+    for _ in range(count):
+        start = rng.randint(1, 10 ** rng.randint(1, max_digits))
+        ranges.append((start, start + rng.randint(0, 5000)))
+    return ranges
 
 
 def test_is_invalid_id():
@@ -192,6 +255,187 @@ def test_multiple_repetition_part2():
     print(f"✓ Part 2 multiple repetition test passed: sum = {result}")
 
 
+def test_generate_invalid_ids():
+    """Cross-check the candidate generators against the is_invalid_id scans."""
+    rng = random.Random(2025)
+    for start, end in random_ranges(rng, 200, 7):
+        scan_1 = [n for n in range(start, end + 1) if is_invalid_id_scan(n)]
+        scan_2 = [n for n in range(start, end + 1) if is_invalid_id_scan_part2(n)]
+        assert list(generate_invalid_ids(start, end)) == scan_1, f"{start}-{end}"
+        assert list(generate_invalid_ids_part2(start, end)) == scan_2, f"{start}-{end}"
+
+    # 1111 is both 1 x 4 and 11 x 2 but must only be generated once
+    assert list(generate_invalid_ids_part2(1000, 1200)) == [1010, 1111]
+    print("✓ Candidate generators match the is_invalid_id scans")
+
+
+def test_sum_invalid_ids():
+    """Cross-check the closed-form sums against the is_invalid_id scans."""
+    rng = random.Random(7)
+    for start, end in random_ranges(rng, 200, 7):
+        scan_1 = sum(n for n in range(start, end + 1) if is_invalid_id_scan(n))
+        scan_2 = sum(n for n in range(start, end + 1) if is_invalid_id_scan_part2(n))
+        assert sum_invalid_ids(start, end) == scan_1, f"{start}-{end}"
+        assert sum_invalid_ids_part2(start, end) == scan_2, f"{start}-{end}"
+
+    # Exhaustive over all IDs up to 6 digits (lengths 4 and 6 need exclusion)
+    scan_2 = sum(n for n in range(1, 10**6) if is_invalid_id_scan_part2(n))
+    assert sum_invalid_ids_part2(1, 10**6 - 1) == scan_2, "Exhaustive mismatch"
+
+    # Wide ranges: compare against the generators instead of a full scan
+    for start, end in [(1, 10**10), (123456, 98765432101)]:
+        assert sum_invalid_ids(start, end) == sum(generate_invalid_ids(start, end))
+        assert sum_invalid_ids_part2(start, end) == sum(
+            generate_invalid_ids_part2(start, end)
+        )
+    print("✓ Closed-form sums match the is_invalid_id scans")
+
+
+def test_is_invalid_id_matches_scan():
+    """Test the engine-backed is_invalid_id wrappers against the string scans."""
+    for num in range(1, 20_000):
+        assert is_invalid_id(num) == is_invalid_id_scan(num), f"Part 1: {num}"
+        assert is_invalid_id_part2(num) == is_invalid_id_scan_part2(num), (
+            f"Part 2: {num}"
+        )
+    print("✓ is_invalid_id wrappers match the string scans")
+
+
+def test_repeated_id_stats_predicates():
+    """Test the repeat engine with other product rules against a scan oracle."""
+    predicates = {
+        "exactly 2": (repeated_exactly(2), lambda r, length: r % 2 == 0),
+        "exactly 3": (repeated_exactly(3), lambda r, length: r % 3 == 0),
+        "at least 3": (repeated_at_least(3), lambda r, length: r >= 3),
+        "period 2 or 3": (
+            repeated_with_periods({2, 3}),
+            lambda r, length: any(
+                p < length and length % p == 0 and p % (length // r) == 0
+                for p in (2, 3)
+            ),
+        ),
+    }
+    rng = random.Random(13)
+    for start, end in random_ranges(rng, 50, 7) + [(1, 10**5)]:
+        repeats = {n: primitive_repeats_scan(n) for n in range(start, end + 1)}
+        for name, (predicate, oracle) in predicates.items():
+            selected = [n for n, r in repeats.items() if oracle(r, len(str(n)))]
+            expected = (len(selected), sum(selected))
+            result = repeated_id_stats(start, end, predicate)
+            assert result == expected, f"{name} {start}-{end}: {result} != {expected}"
+
+    # 111111 is 1 x 6 = 11 x 3 = 111 x 2, so it repeats exactly 2, 3 and 6 times
+    assert repeated_id_stats(111111, 111111, repeated_exactly(3)) == (1, 111111)
+    assert repeated_id_stats(121212, 121212, repeated_exactly(2)) == (0, 0)
+    print("✓ Repeat engine matches scans for other product rules")
+
+
+def test_merge_ranges():
+    """Test that overlapping and adjacent ranges are merged."""
+    merged = merge_ranges([(50, 60), (10, 20), (15, 30), (31, 40), (45, 45)])
+    expected = [(10, 40), (45, 45), (50, 60)]
+    assert merged == expected, f"Expected {expected}, got {merged}"
+
+    # Overlapping ranges must not count shared invalid IDs twice
+    assert solve_part1(["10-30", "20-40"]) == 11 + 22 + 33
+    assert solve_part2(["100-120", "110-112", "95-111"]) == 99 + 111
+    print("✓ Range merging test passed")
+
+
+def test_invalid_id_index():
+    """Test indexed range sums against generated IDs and the closed-form sums."""
+    index_1 = build_index()
+    index_2 = build_index_part2()
+    rng = random.Random(3)
+    for start, end in random_ranges(rng, 500, 9):
+        assert index_1.range_sum(start, end) == sum(generate_invalid_ids(start, end))
+        assert index_2.range_sum(start, end) == sum(
+            generate_invalid_ids_part2(start, end)
+        )
+
+    # Huge ranges are answered from closed-form totals, one per digit length
+    for start, end in [(1, 10**30), (10**17 + 3, 10**25 - 7)]:
+        assert index_1.range_sum(start, end) == sum_invalid_ids(start, end)
+        assert index_2.range_sum(start, end) == sum_invalid_ids_part2(start, end)
+    assert len(index_1.length_sums) == 31, "Expected one cached total per length"
+
+    # Reversed ranges are empty, as with the generators
+    assert solve_part1(["100-11"], index=index_1) == 0
+    assert solve_part2(["100-11"], index=index_2) == 0
+
+    ranges = ["11-22", "95-115", "998-1012", "1188511880-1188511890"]
+    assert solve_part1(ranges, index=index_1) == solve_part1(ranges)
+    assert solve_part2(ranges, index=index_2) == solve_part2(ranges)
+    print("✓ Query index matches generated IDs and closed-form sums")
+
+
+def run_serve_load(queries: list[str], part: str = "part_2.py") -> list[str]:
+    """Load generator: pipe queries one at a time into --serve, read each reply."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), part)
+    with subprocess.Popen(
+        [sys.executable, script, "--serve"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        responses = []
+        for query in queries:
+            proc.stdin.write(query + "\n")
+            proc.stdin.flush()
+            responses.append(proc.stdout.readline().strip())
+        proc.stdin.close()
+    return responses
+
+
+def random_queries(rng: random.Random, count: int) -> list[str]:
+    """Generate random query batches of one to three ranges."""
+    queries = []
+    for _ in range(count):
+        ranges = random_ranges(rng, rng.randint(1, 3), 10)
+        queries.append(",".join(f"{start}-{end}" for start, end in ranges))
+    return queries
+
+
+def test_serve_mode():
+    """Drive --serve through a pipe and check every response."""
+    rng = random.Random(9)
+    queries = random_queries(rng, 300)
+    responses = run_serve_load(queries)
+    for query, response in zip(queries, responses):
+        expected = solve_part2(query.split(","))
+        assert response == str(expected), (
+            f"{query}: expected {expected}, got {response}"
+        )
+    assert len(responses) == len(queries), "Missing responses"
+
+    # Very wide queries must not make the server enumerate IDs, and reversed
+    # ranges must answer 0 rather than a negative sum
+    huge = ["1-99999999999999", f"1-{10**30}", f"{10**19}-{10**20 - 1}", "100-11"]
+    for part, solve in (("part_1.py", solve_part1), ("part_2.py", solve_part2)):
+        start = time.perf_counter()
+        responses = run_serve_load(huge, part)
+        elapsed = time.perf_counter() - start
+        expected = [str(solve([query])) for query in huge]
+        assert responses == expected, f"{part}: expected {expected}, got {responses}"
+        assert elapsed < 5, f"{part}: huge queries took {elapsed:.1f}s"
+    print(f"✓ Serve mode answered {len(queries)} piped queries correctly")
+
+
+def stress_serve_mode(count: int = 100_000):
+    """Measure --serve throughput and latency with the pipe load generator."""
+    rng = random.Random(0)
+    queries = random_queries(rng, count)
+    start = time.perf_counter()
+    responses = run_serve_load(queries)
+    elapsed = time.perf_counter() - start
+    assert len(responses) == count, "Missing responses"
+    print(
+        f"{count:,} queries in {elapsed:.2f}s: {count / elapsed:,.0f} queries/s, "
+        f"{elapsed / count * 1e6:.0f}µs mean round trip"
+    )
+
+
 def run_tests():
     """Run all tests."""
     print("Running Day 2 tests...\n")
@@ -206,8 +450,23 @@ def run_tests():
     test_example_part2()
     test_triple_pattern_part2()
     test_multiple_repetition_part2()
+    print("\n=== Generator Tests ===")
+    test_generate_invalid_ids()
+    test_sum_invalid_ids()
+    print("\n=== Repeat Engine Tests ===")
+    test_is_invalid_id_matches_scan()
+    test_repeated_id_stats_predicates()
+    print("\n=== Range Merging and Index Tests ===")
+    test_merge_ranges()
+    test_invalid_id_index()
+    print("\n=== Serve Mode Tests ===")
+    test_serve_mode()
     print("\n✓ All tests passed!")
 
 
 if __name__ == "__main__":
-    run_tests()
+    if "--stress" in sys.argv:
+        args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+        stress_serve_mode(int(args[0]) if args else 100_000)
+    else:
+        run_tests()
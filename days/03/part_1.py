@@ -13,7 +13,227 @@ Example: 987654321111111
 - etc.
 """
 
+import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# Inputs smaller than this are solved serially; pool startup would dominate
+PARALLEL_MIN_BYTES = 1 << 20
+
+
+def find_max_joltage_k(bank: str, k: int) -> int:
+    """
+    Find the maximum k-digit joltage from a battery bank in O(n).
+
+    Choosing k batteries in order is the same as deleting n - k digits to
+    leave the largest number. A monotonic stack does this in one pass:
+    while deletions remain, a digit pops every smaller digit before it,
+    since putting the larger digit earlier always wins. Comparing the
+    characters directly works because '1' < '2' < ... < '9' in ASCII.
+
+    Args:
+        bank: String of digits representing battery joltage ratings
+        k: Number of batteries to select
+
+    Returns:
+        Maximum k-digit number that can be formed, or 0 if the bank has
+        fewer than k batteries
+    """
+    n = len(bank)
+    if k <= 0 or n < k:
+        return 0
+
+    to_remove = n - k
+    stack = []
+
+    for char in bank:
+        # Drop smaller digits that a larger one can replace
+        while to_remove and stack and stack[-1] < char:
+            stack.pop()
+            to_remove -= 1
+        stack.append(char)
+
+    # Any deletions left over come off the (non-increasing) tail
+    return int("".join(stack[:k]))
+
+
+def find_max_joltage_bytes(bank: bytes | memoryview, k: int) -> int:
+    """
+    Bytes-level `find_max_joltage_k`: the bank is a buffer of ASCII digit codes.
+
+    Iterating a bytes-like object yields small ints (cached by Python), the
+    stack is a single bytearray, and digits are only converted once when
+    int() parses the final k bytes, so no per-digit objects are created.
+
+    Args:
+        bank: ASCII digits, e.g. a memoryview slice of the input file
+        k: Number of batteries to select
+
+    Returns:
+        Maximum k-digit number that can be formed, or 0 if the bank has
+        fewer than k batteries
+    """
+    n = len(bank)
+    if k <= 0 or n < k:
+        return 0
+
+    to_remove = n - k
+    stack = bytearray()
+
+    for code in bank:
+        # Drop smaller digits that a larger one can replace
+        while to_remove and stack and stack[-1] < code:
+            stack.pop()
+            to_remove -= 1
+        stack.append(code)
+
+    del stack[k:]
+    return int(stack)
+
+
+def iter_banks_bytes(data: bytes) -> Iterator[memoryview]:
+    """
+    Yield each bank in `data` as a zero-copy memoryview slice.
+
+    Args:
+        data: Raw input file contents
+
+    Yields:
+        One memoryview per non-blank line, without line endings or spaces
+    """
+    view = memoryview(data)
+    pos = 0
+    size = len(data)
+
+    while pos < size:
+        newline = data.find(b"\n", pos)
+        if newline == -1:
+            newline = size
+        start, end = pos, newline
+        # Trim surrounding whitespace (including '\r') without copying
+        while start < end and data[start] in b" \t\r":
+            start += 1
+        while end > start and data[end - 1] in b" \t\r":
+            end -= 1
+        if start < end:
+            yield view[start:end]
+        pos = newline + 1
+
+
+def solve_bytes(data: bytes, k: int = 2) -> int:
+    """
+    Sum the maximum k-digit joltages of all banks in raw input bytes.
+
+    Args:
+        data: Raw input file contents
+        k: Number of batteries to select per bank
+
+    Returns:
+        Sum of maximum joltages from all banks
+    """
+    return sum(find_max_joltage_bytes(bank, k) for bank in iter_banks_bytes(data))
+
+
+def line_aligned_boundaries(filename: str, chunks: int) -> list[int]:
+    """
+    Split a file into up to `chunks` byte ranges that start at line starts.
+
+    Returns:
+        Sorted offsets [0, ..., file size]; consecutive pairs are the chunks
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+    with open(filename, "rb") as f:
+        for i in range(1, chunks):
+            # Move each even cut point forward to the start of the next line
+            f.seek(size * i // chunks)
+            f.readline()
+            offset = min(f.tell(), size)
+            if offset > boundaries[-1]:
+                boundaries.append(offset)
+    if boundaries[-1] < size:
+        boundaries.append(size)
+    return boundaries
+
+
+def solve_chunk(filename: str, start: int, end: int, k: int) -> int:
+    """Worker: sum the maximum k-digit joltages of the banks in one byte range."""
+    with open(filename, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return solve_bytes(data, k)
+
+
+def solve_parallel(
+    filename: str,
+    k: int = 2,
+    workers: int | None = None,
+    min_bytes: int = PARALLEL_MIN_BYTES,
+) -> int:
+    """
+    Sum the maximum k-digit joltages with banks fanned out over processes.
+
+    The file is split into line-aligned chunks, each worker sums its chunk,
+    and the integer partial sums are added in chunk order, so the result is
+    identical to the serial solver.
+
+    Args:
+        filename: Input file with one bank per line
+        k: Number of batteries to select per bank
+        workers: Number of worker processes (default: os.cpu_count())
+        min_bytes: Inputs smaller than this are solved serially
+
+    Returns:
+        Sum of maximum joltages from all banks
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Serial fallback for a single worker or tiny inputs
+    if workers <= 1 or os.path.getsize(filename) < min_bytes:
+        with open(filename, "rb") as f:
+            return solve_bytes(f.read(), k)
+
+    boundaries = line_aligned_boundaries(filename, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partial_sums = pool.map(
+            solve_chunk,
+            repeat(filename),
+            boundaries[:-1],
+            boundaries[1:],
+            repeat(k),
+        )
+        return sum(partial_sums)
+
+
+def parse_workers_arg(argv: list[str]) -> tuple[bool, int | None]:
+    """
+    Parse '--workers [N]' from the command line.
+
+    Returns:
+        (whether parallel mode was requested, worker count or None for default)
+    """
+    if "--workers" not in argv:
+        return False, None
+    i = argv.index("--workers")
+    if i + 1 < len(argv) and argv[i + 1].isdigit():
+        return True, int(argv[i + 1])
+    return True, None
+
+
+def positional_args(argv: list[str]) -> list[str]:
+    """Return arguments that are neither flags nor the count after '--workers'."""
+    args = []
+    for i, arg in enumerate(argv[1:], start=1):
+        if arg.startswith("--"):
+            continue
+        # parse_workers_arg takes a digit string right after --workers as N
+        if argv[i - 1] == "--workers" and arg.isdigit():
+            continue
+        args.append(arg)
+    return args
 
 
 def find_max_joltage(bank: str) -> int:
@@ -24,6 +244,19 @@ def find_max_joltage(bank: str) -> int:
     The order is preserved - if we pick batteries at positions i and j (where i < j),
     the joltage is int(bank[i] + bank[j]).
 
+    Args:
+        bank: String of digits representing battery joltage ratings
+
+    Returns:
+        Maximum 2-digit number that can be formed from any two batteries
+    """
+    return find_max_joltage_k(bank, 2)
+
+
+def find_max_joltage_pairs(bank: str) -> int:
+    """
+    Reference O(n²) solver that tries every pair of batteries.
+
     Args:
         bank: String of digits representing battery joltage ratings
 
@@ -61,20 +294,26 @@ def solve(banks: list[str]) -> int:
     return total
 
 
-def solve_from_file(filename: str) -> int:
-    """Solve using input from a file."""
-    with open(filename, "r") as f:
-        banks = [line.strip() for line in f if line.strip()]
-    return solve(banks)
+def solve_from_file(
+    filename: str, parallel: bool = False, workers: int | None = None
+) -> int:
+    """Solve using input from a file, processed as raw bytes."""
+    if parallel:
+        return solve_parallel(filename, 2, workers)
+    with open(filename, "rb") as f:
+        data = f.read()
+    return solve_bytes(data, 2)
 
 
 def main():
     """Main entry point - solve puzzle."""
     # Parse command line arguments
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    parallel, workers = parse_workers_arg(sys.argv)
+    args = positional_args(sys.argv)
+    input_file = args[0] if args else "input.txt"
 
     # Solve the actual puzzle
-    answer = solve_from_file(input_file)
+    answer = solve_from_file(input_file, parallel, workers)
     print(answer)
 
 
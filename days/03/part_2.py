@@ -12,6 +12,14 @@ value for the remaining positions. This ensures we get the largest possible numb
 
 import sys
 
+from part_1 import (
+    find_max_joltage_k,
+    parse_workers_arg,
+    positional_args,
+    solve_bytes,
+    solve_parallel,
+)
+
 
 def find_max_joltage_12(bank: str) -> int:
     """
@@ -20,29 +28,43 @@ def find_max_joltage_12(bank: str) -> int:
     We need to pick exactly 12 batteries to form a 12-digit number.
     The order is preserved - we can only select batteries, not rearrange them.
 
+    Args:
+        bank: String of digits representing battery joltage ratings
+
+    Returns:
+        Maximum 12-digit number that can be formed from 12 batteries
+    """
+    return find_max_joltage_k(bank, 12)
+
+
+def find_max_joltage_window(bank: str, k: int = 12) -> int:
+    """
+    Reference O(n·k) greedy window scan for the maximum k-digit joltage.
+
     Strategy: Greedy algorithm - at each step, choose the position that
     maximizes the resulting number given the remaining positions to fill.
 
     Args:
         bank: String of digits representing battery joltage ratings
+        k: Number of batteries to select
 
     Returns:
-        Maximum 12-digit number that can be formed from 12 batteries
+        Maximum k-digit number that can be formed from k batteries
     """
     n = len(bank)
-    if n < 12:
+    if k <= 0 or n < k:
         # Not enough batteries
         return 0
 
-    # We need to select 12 positions from n positions
+    # We need to select k positions from n positions
     # Greedy approach: at each step, select the position with the maximum digit
     # that still leaves enough positions for the remaining selections
 
     selected_indices = []
-    remaining_to_select = 12
+    remaining_to_select = k
     start_pos = 0
 
-    for i in range(12):
+    for i in range(k):
         # How many positions do we need after this one?
         remaining_after = remaining_to_select - 1
 
@@ -61,11 +83,89 @@ def find_max_joltage_12(bank: str) -> int:
         start_pos = max_pos + 1
         remaining_to_select -= 1
 
-    # Form the 12-digit number from selected positions
+    # Form the k-digit number from selected positions
     result_str = "".join(bank[i] for i in selected_indices)
     return int(result_str)
 
 
+class BankIndex:
+    """
+    Sparse table over a bank's digits for O(1) leftmost range-argmax queries.
+
+    table[j][i] holds the leftmost position of the largest digit in
+    bank[i : i + 2^j]. Any range is covered by two overlapping power-of-two
+    windows, so a query is two lookups. Building costs O(n log n) once; after
+    that every greedy step of a k-digit selection is O(1), for any k and any
+    sub-window of the bank.
+    """
+
+    def __init__(self, bank: str):
+        self.bank = bank
+        self.table = [list(range(len(bank)))]
+
+        width = 2
+        while width <= len(bank):
+            prev = self.table[-1]
+            half = width // 2
+            row = []
+            for i in range(len(bank) - width + 1):
+                left, right = prev[i], prev[i + half]
+                # Prefer the left position on ties
+                row.append(left if bank[left] >= bank[right] else right)
+            self.table.append(row)
+            width *= 2
+
+    def argmax(self, lo: int, hi: int) -> int:
+        """Return the leftmost position of the largest digit in bank[lo..hi]."""
+        level = (hi - lo + 1).bit_length() - 1
+        left = self.table[level][lo]
+        right = self.table[level][hi - (1 << level) + 1]
+        return left if self.bank[left] >= self.bank[right] else right
+
+    def max_joltage(self, k: int = 12, start: int = 0, end: int | None = None) -> int:
+        """
+        Find the maximum k-digit joltage within bank[start:end].
+
+        Same greedy as `find_max_joltage_window`, with each window scan
+        replaced by an `argmax` lookup, so a query costs O(k).
+
+        Args:
+            k: Number of batteries to select
+            start: First position of the sub-window (inclusive)
+            end: Last position of the sub-window (exclusive), default bank end
+
+        Returns:
+            Maximum k-digit number, or 0 if the window has fewer than k batteries
+        """
+        if end is None:
+            end = len(self.bank)
+        if k <= 0 or end - start < k:
+            return 0
+
+        digits = []
+        pos = start
+        for remaining in range(k, 0, -1):
+            # Leave room for the remaining - 1 digits after this one
+            best = self.argmax(pos, end - remaining)
+            digits.append(self.bank[best])
+            pos = best + 1
+        return int("".join(digits))
+
+
+def solve_indexed(indexes: list[BankIndex], k: int = 12) -> int:
+    """
+    Sum the maximum k-digit joltages using prebuilt bank indexes.
+
+    Args:
+        indexes: One BankIndex per bank, built once and reused across calls
+        k: Number of batteries to select per bank
+
+    Returns:
+        Sum of maximum k-digit joltages from all banks
+    """
+    return sum(index.max_joltage(k) for index in indexes)
+
+
 def solve(banks: list[str]) -> int:
     """
     Find the total output joltage from all battery banks.
@@ -85,20 +185,26 @@ def solve(banks: list[str]) -> int:
     return total
 
 
-def solve_from_file(filename: str) -> int:
-    """Solve using input from a file."""
-    with open(filename, "r") as f:
-        banks = [line.strip() for line in f if line.strip()]
-    return solve(banks)
+def solve_from_file(
+    filename: str, parallel: bool = False, workers: int | None = None
+) -> int:
+    """Solve using input from a file, processed as raw bytes."""
+    if parallel:
+        return solve_parallel(filename, 12, workers)
+    with open(filename, "rb") as f:
+        data = f.read()
+    return solve_bytes(data, 12)
 
 
 def main():
     """Main entry point - solve puzzle."""
     # Parse command line arguments
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    parallel, workers = parse_workers_arg(sys.argv)
+    args = positional_args(sys.argv)
+    input_file = args[0] if args else "input.txt"
 
     # Solve the actual puzzle
-    answer = solve_from_file(input_file)
+    answer = solve_from_file(input_file, parallel, workers)
     print(answer)
 
 
@@ -3,8 +3,38 @@
 Tests for Day 3: Lobby
 """
 
-from part_1 import solve as solve_part1, find_max_joltage
-from part_2 import solve as solve_part2, find_max_joltage_12
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import pairwise
+
+from part_1 import (
+    solve as solve_part1,
+    find_max_joltage,
+    find_max_joltage_bytes,
+    find_max_joltage_k,
+    find_max_joltage_pairs,
+    iter_banks_bytes,
+    line_aligned_boundaries,
+    parse_workers_arg,
+    positional_args,
+    solve_bytes,
+    solve_parallel,
+)
+from part_2 import (
+    solve as solve_part2,
+    BankIndex,
+    find_max_joltage_12,
+    find_max_joltage_window,
+    solve_indexed,
+)
+
+
+def random_bank(rng: random.Random, length: int) -> str:
+    """Generate a random bank of digits 1-9."""
+    return "".join(rng.choice("123456789") for _ in range(length))
 
 
 def test_find_max_joltage():
@@ -66,6 +96,31 @@ def test_ascending_descending_part1():
     print(f"✓ Part 1 ascending/descending test passed: total = {result}")
 
 
+def test_stack_matches_pairs_part1():
+    """Cross-check the monotonic-stack engine (k = 2) against the pair scan."""
+    rng = random.Random(2025)
+    for _ in range(300):
+        bank = random_bank(rng, rng.randint(2, 40))
+        expected = find_max_joltage_pairs(bank)
+        result = find_max_joltage(bank)
+        assert result == expected, f"{bank}: expected {expected}, got {result}"
+    print("✓ Stack engine (k = 2) matches pair scan on random banks")
+
+
+def benchmark_part1(sizes: tuple[int, ...] = (250_000, 500_000, 1_000_000)):
+    """Show that the stack engine scales linearly with bank length for k = 2."""
+    rng = random.Random(0)
+    previous = None
+    for size in sizes:
+        bank = random_bank(rng, size)
+        start = time.perf_counter()
+        find_max_joltage(bank)
+        elapsed = time.perf_counter() - start
+        ratio = f" ({elapsed / previous:.2f}x previous)" if previous else ""
+        print(f"Part 1, {size:,} digits: {elapsed * 1000:.1f}ms{ratio}")
+        previous = elapsed
+
+
 def test_find_max_joltage_12():
     """Test the find_max_joltage_12 function with individual banks."""
     assert find_max_joltage_12("987654321111111") == 987654321111, (
@@ -121,6 +176,113 @@ def test_descending_part2():
     print(f"✓ Part 2 descending test passed: total = {result}")
 
 
+def test_stack_matches_window():
+    """Cross-check the monotonic-stack engine against the greedy window scan."""
+    rng = random.Random(12)
+    for _ in range(300):
+        bank = random_bank(rng, rng.randint(1, 60))
+        k = rng.randint(1, len(bank))
+        expected = find_max_joltage_window(bank, k)
+        result = find_max_joltage_k(bank, k)
+        assert result == expected, f"{bank}, k={k}: expected {expected}, got {result}"
+
+    assert find_max_joltage_k("12345", 6) == 0, "Too few batteries should give 0"
+    assert find_max_joltage_k("12345", 5) == 12345, "k = n keeps every battery"
+    assert find_max_joltage_k("91119", 3) == 919, "Stack should pop the 1s for 9"
+    print("✓ Monotonic-stack engine matches greedy window scan for random k")
+
+
+def test_bank_index():
+    """Test sparse-table argmax and indexed queries over sub-windows and k."""
+    rng = random.Random(13)
+    for _ in range(50):
+        bank = random_bank(rng, rng.randint(1, 70))
+        index = BankIndex(bank)
+
+        # Leftmost argmax against a direct scan
+        for _ in range(20):
+            lo = rng.randrange(len(bank))
+            hi = rng.randrange(lo, len(bank))
+            expected = max(range(lo, hi + 1), key=lambda i: (bank[i], -i))
+            assert index.argmax(lo, hi) == expected, f"{bank}[{lo}..{hi}]"
+
+        # The same index answers many (k, sub-window) queries
+        for _ in range(20):
+            start = rng.randrange(len(bank))
+            end = rng.randint(start + 1, len(bank))
+            k = rng.randint(1, end - start)
+            expected = find_max_joltage_window(bank[start:end], k)
+            result = index.max_joltage(k, start, end)
+            assert result == expected, f"{bank}[{start}:{end}], k={k}"
+
+    banks = ["987654321111111", "811111111111119", "234234234234278", "818181911112111"]
+    indexes = [BankIndex(bank) for bank in banks]
+    assert solve_indexed(indexes) == 3121910778619, "Indexed Part 2 mismatch"
+    assert solve_indexed(indexes, k=2) == 357, "Indexed Part 1 mismatch"
+    print("✓ Sparse-table bank index matches window scans")
+
+
+def test_bytes_path():
+    """Test the bytes/memoryview path against the str path."""
+    data = b"987654321111111\r\n\n  811111111111119\n234234234234278\n818181911112111"
+    banks = [bytes(bank) for bank in iter_banks_bytes(data)]
+    expected = [
+        b"987654321111111",
+        b"811111111111119",
+        b"234234234234278",
+        b"818181911112111",
+    ]
+    assert banks == expected, f"Expected {expected}, got {banks}"
+    assert solve_bytes(data, 2) == 357, "Bytes Part 1 mismatch"
+    assert solve_bytes(data, 12) == 3121910778619, "Bytes Part 2 mismatch"
+
+    rng = random.Random(14)
+    for _ in range(300):
+        bank = random_bank(rng, rng.randint(1, 60))
+        k = rng.randint(1, len(bank) + 1)
+        expected = find_max_joltage_k(bank, k)
+        result = find_max_joltage_bytes(memoryview(bank.encode()), k)
+        assert result == expected, f"{bank}, k={k}: expected {expected}, got {result}"
+    print("✓ Bytes path matches str path")
+
+
+def test_solve_parallel():
+    """Test line-aligned chunking and the process-pool solver."""
+    rng = random.Random(15)
+    banks = [random_bank(rng, rng.randint(12, 80)) for _ in range(400)]
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "banks.txt")
+        with open(filename, "w") as f:
+            f.write("\n".join(banks) + "\n")
+
+        # Chunks start at line starts and cover every bank exactly once
+        with open(filename, "rb") as f:
+            data = f.read()
+        for chunks in (1, 2, 7, 64, 5000):
+            boundaries = line_aligned_boundaries(filename, chunks)
+            pieces = [data[a:b] for a, b in pairwise(boundaries)]
+            assert b"".join(pieces) == data, f"{chunks} chunks lost bytes"
+            assert all(p.endswith(b"\n") for p in pieces), "Chunk split a line"
+
+        for k in (2, 12):
+            expected = solve_part1(banks) if k == 2 else solve_part2(banks)
+            result = solve_parallel(filename, k, workers=3, min_bytes=0)
+            assert result == expected, f"k={k}: expected {expected}, got {result}"
+            serial = solve_parallel(filename, k, workers=3)
+            assert serial == expected, f"k={k}: serial fallback mismatch"
+
+    # The worker count is removed by position, however it is spelled
+    for argv, expected in [
+        (["part_1.py", "--workers", "08", "in.txt"], (True, 8, ["in.txt"])),
+        (["part_1.py", "in.txt", "--workers", "4"], (True, 4, ["in.txt"])),
+        (["part_1.py", "--workers", "in.txt"], (True, None, ["in.txt"])),
+        (["part_1.py", "4"], (False, None, ["4"])),
+    ]:
+        result = (*parse_workers_arg(argv), positional_args(argv))
+        assert result == expected, f"{argv}: expected {expected}, got {result}"
+    print("✓ Parallel solver matches serial solver")
+
+
 def run_tests():
     """Run all tests."""
     print("Running Day 3 tests...\n")
@@ -130,13 +292,21 @@ def run_tests():
     test_single_bank_part1()
     test_all_same_digits_part1()
     test_ascending_descending_part1()
+    test_stack_matches_pairs_part1()
     print("\n=== Part 2 Tests ===")
     test_find_max_joltage_12()
     test_example_part2()
     test_all_same_digits_part2()
     test_descending_part2()
+    test_stack_matches_window()
+    test_bank_index()
+    test_bytes_path()
+    test_solve_parallel()
     print("\n✓ All tests passed!")
 
 
 if __name__ == "__main__":
-    run_tests()
+    if "--benchmark" in sys.argv:
+        benchmark_part1()
+    else:
+        run_tests()
@@ -11,7 +11,24 @@ Grid notation:
 - '.' = empty space
 """
 
+import mmap
+import os
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python scan
+    np = None
+
+# Rows per band in the out-of-core (memory-mapped) mode
+BAND_ROWS = 4096
+
+# Grid files smaller than this are counted serially by solve_parallel
+PARALLEL_MIN_BYTES = 1 << 20
 
 
 def count_accessible_rolls(grid: list[str]) -> int:
@@ -59,21 +76,338 @@ def count_accessible_rolls(grid: list[str]) -> int:
     return accessible_count
 
 
+def grid_to_array(grid: list[str]) -> "np.ndarray":
+    """Convert the grid to a uint8 NumPy array with 1 for rolls, 0 otherwise."""
+    data = np.frombuffer("".join(grid).encode(), dtype=np.uint8)
+    return (data == ord("@")).astype(np.uint8).reshape(len(grid), len(grid[0]))
+
+
+def neighbor_counts(rolls: "np.ndarray") -> "np.ndarray":
+    """
+    Count the rolls among each cell's 8 neighbours with a 3x3 box sum.
+
+    The box sum is separable: add the three horizontally shifted slices of
+    the zero-padded grid, then the three vertically shifted slices of that,
+    and subtract the cell itself. Counts are at most 8, so uint8 is enough.
+    """
+    padded = np.pad(rolls, 1)
+    row_sums = padded[:, :-2] + padded[:, 1:-1] + padded[:, 2:]
+    box_sums = row_sums[:-2] + row_sums[1:-1] + row_sums[2:]
+    return box_sums - rolls
+
+
+def count_accessible_rolls_numpy(grid: list[str]) -> int:
+    """
+    Vectorized `count_accessible_rolls`: one box sum and one boolean reduction.
+
+    Args:
+        grid: List of strings representing the grid (all rows the same length)
+
+    Returns:
+        Number of accessible paper rolls
+    """
+    if not grid or not grid[0]:
+        return 0
+
+    rolls = grid_to_array(grid)
+    accessible = (rolls == 1) & (neighbor_counts(rolls) < 4)
+    return int(np.count_nonzero(accessible))
+
+
+class PackedGrid:
+    """
+    Compact grid: each row is a Python int bitset (bit c set = roll at column c).
+
+    One bit per cell instead of a str character (or a list entry per cell),
+    and whole rows are processed with a few big-int operations, which work
+    on machine words internally.
+    """
+
+    # Map '@' to '1' and '.' to '0' so a row can be parsed with int(..., 2)
+    TO_BITS = str.maketrans("@.", "10")
+
+    def __init__(self, rows: list[int], width: int):
+        self.rows = rows
+        self.width = width
+        self.mask = (1 << width) - 1
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "PackedGrid":
+        """Pack grid lines, reading them one at a time."""
+        rows = []
+        width = 0
+        for line in lines:
+            line = line.rstrip("\n")
+            width = max(width, len(line))
+            # Reverse so that column 0 becomes the least significant bit
+            rows.append(int(line[::-1].translate(cls.TO_BITS) or "0", 2))
+        return cls(rows, width)
+
+    @classmethod
+    def from_file(cls, filename: str) -> "PackedGrid":
+        """Pack a grid file without holding its lines in memory."""
+        with open(filename, "r") as f:
+            return cls.from_lines(f)
+
+
+def accessible_row_mask(above: int, row: int, below: int, mask: int) -> int:
+    """
+    Return the bitset of rolls in `row` that have fewer than 4 neighbours.
+
+    The 8 neighbour bitsets are the three-row window shifted left/right.
+    They are summed per column with bit-sliced adders: `ones` and `twos`
+    hold the low bits of each column's count and `fours` latches once a
+    count reaches 4, which is all the threshold needs.
+    """
+    ones = twos = fours = 0
+    for neighbors in (
+        above << 1,
+        above,
+        above >> 1,
+        row << 1,
+        row >> 1,
+        below << 1,
+        below,
+        below >> 1,
+    ):
+        neighbors &= mask
+        carry = ones & neighbors
+        ones ^= neighbors
+        fours |= twos & carry
+        twos ^= carry
+    return row & ~fours
+
+
+def accessible_masks(grid: PackedGrid) -> Iterator[int]:
+    """Yield the accessible-roll bitset of each row, using a three-row window."""
+    rows = grid.rows
+    for r, row in enumerate(rows):
+        above = rows[r - 1] if r > 0 else 0
+        below = rows[r + 1] if r + 1 < len(rows) else 0
+        yield accessible_row_mask(above, row, below, grid.mask)
+
+
+def count_accessible_rolls_packed(grid: PackedGrid) -> int:
+    """
+    Bit-packed `count_accessible_rolls`.
+
+    Args:
+        grid: Bit-packed grid
+
+    Returns:
+        Number of accessible paper rolls
+    """
+    return sum(mask.bit_count() for mask in accessible_masks(grid))
+
+
+class MappedGrid:
+    """
+    Grid file accessed through a memory map; rows are packed on demand.
+
+    The grid must be rectangular with one newline after each row (optional
+    after the last), so row r starts at byte r * (width + 1). The file size
+    is checked up front and each row is checked as it is read, so ragged or
+    malformed grids raise ValueError instead of being misread. Nothing is
+    read until a row is asked for, and the OS can drop mapped pages again,
+    so resident memory follows the rows in use rather than the file size.
+    """
+
+    TO_BITS = bytes.maketrans(b"@.", b"10")
+    FROM_BITS = str.maketrans("10", "@.")
+
+    def __init__(self, buffer, width: int):
+        self.buffer = buffer
+        self.width = width
+        self.stride = width + 1
+        self.height = (len(buffer) + 1) // self.stride if width else 0
+        self.mask = (1 << width) - 1
+        # Every row takes `stride` bytes, except that the last newline may be missing
+        if width and len(buffer) % self.stride not in (0, width):
+            raise ValueError(f"Grid rows are not all {width} cells wide")
+
+    @classmethod
+    @contextmanager
+    def open(cls, filename: str) -> Iterator["MappedGrid"]:
+        """Map a grid file read-only for the duration of the `with` block."""
+        with open(filename, "rb") as f:
+            first_line = f.readline()
+            width = len(first_line.rstrip(b"\n"))
+            if not width:
+                # mmap cannot map an empty file
+                yield cls(b"", 0)
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield cls(buffer, width)
+
+    def row(self, r: int) -> int:
+        """Return row r as a bitset, or 0 for rows outside the grid."""
+        if not 0 <= r < self.height:
+            return 0
+        start = r * self.stride
+        line = self.buffer[start : start + self.stride]
+        cells, terminator = line[: self.width], line[self.width :]
+        if terminator not in (b"\n", b"") or cells.translate(None, b"@."):
+            raise ValueError(f"Row {r} is not {self.width} grid cells and a newline")
+        return int(cells[::-1].translate(self.TO_BITS), 2)
+
+    def store_row(self, r: int, bits: int):
+        """Write a bitset back as row r (the buffer must be writable)."""
+        start = r * self.stride
+        cells = format(bits, f"0{self.width}b")[::-1].translate(self.FROM_BITS)
+        self.buffer[start : start + self.width] = cells.encode()
+
+    def band(self, start: int, stop: int) -> list[int]:
+        """Return rows start-1 .. stop as bitsets: the band plus a one-row halo."""
+        return [self.row(r) for r in range(start - 1, stop + 1)]
+
+    def bands(
+        self, band_rows: int = BAND_ROWS, first: int = 0, last: int | None = None
+    ) -> Iterator[tuple[int, int]]:
+        """Yield (start, stop) row ranges covering rows first..last in bands."""
+        last = self.height if last is None else min(last, self.height)
+        for start in range(first, last, band_rows):
+            yield start, min(start + band_rows, last)
+
+
+def count_accessible_rolls_banded(
+    grid: MappedGrid,
+    band_rows: int = BAND_ROWS,
+    first: int = 0,
+    last: int | None = None,
+) -> int:
+    """
+    Out-of-core `count_accessible_rolls` over a memory-mapped grid.
+
+    Each band is packed with a one-row halo above and below, counted with
+    the bit-sliced row masks and dropped, so only band_rows + 2 packed rows
+    are held at a time.
+
+    Args:
+        grid: Memory-mapped grid
+        band_rows: Rows per band
+        first: First row to count
+        last: Row to stop counting at (default: the end of the grid)
+
+    Returns:
+        Number of accessible paper rolls in rows first..last
+    """
+    total = 0
+    for start, stop in grid.bands(band_rows, first, last):
+        rows = grid.band(start, stop)
+        for i in range(1, len(rows) - 1):
+            mask = accessible_row_mask(rows[i - 1], rows[i], rows[i + 1], grid.mask)
+            total += mask.bit_count()
+    return total
+
+
+def count_rows_chunk(filename: str, first: int, last: int) -> int:
+    """Worker: count accessible rolls in rows first..last of a grid file."""
+    with MappedGrid.open(filename) as grid:
+        return count_accessible_rolls_banded(grid, BAND_ROWS, first, last)
+
+
+def solve_parallel(
+    filename: str,
+    workers: int | None = None,
+    min_bytes: int = PARALLEL_MIN_BYTES,
+) -> int:
+    """
+    Count accessible rolls with horizontal bands fanned out over processes.
+
+    Each worker maps the grid file read-only and counts its own rows, with
+    the one-row halo read from the same mapping. The grid pages are shared
+    through the OS page cache, so only (filename, first, last) is pickled
+    per task and the map is never copied between processes.
+
+    Args:
+        filename: Grid file
+        workers: Number of worker processes (default: os.cpu_count())
+        min_bytes: Grid files smaller than this are counted serially
+
+    Returns:
+        Number of accessible paper rolls
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with MappedGrid.open(filename) as grid:
+        # Serial fallback for a single worker or tiny grids
+        if workers <= 1 or len(grid.buffer) < min_bytes:
+            return count_accessible_rolls_banded(grid)
+        height = grid.height
+
+    # Even row split; consecutive pairs are the workers' row ranges
+    boundaries = sorted({height * i // workers for i in range(workers + 1)})
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partial_counts = pool.map(
+            count_rows_chunk,
+            repeat(filename),
+            boundaries[:-1],
+            boundaries[1:],
+        )
+        return sum(partial_counts)
+
+
+def parse_workers_arg(argv: list[str]) -> tuple[bool, int | None]:
+    """
+    Parse '--workers [N]' from the command line.
+
+    Returns:
+        (whether parallel mode was requested, worker count or None for default)
+    """
+    if "--workers" not in argv:
+        return False, None
+    i = argv.index("--workers")
+    if i + 1 < len(argv) and argv[i + 1].isdigit():
+        return True, int(argv[i + 1])
+    return True, None
+
+
+def positional_args(argv: list[str]) -> list[str]:
+    """Return arguments that are neither flags nor the count after '--workers'."""
+    args = []
+    for i, arg in enumerate(argv[1:], start=1):
+        if arg.startswith("--"):
+            continue
+        # parse_workers_arg takes a digit string right after --workers as N
+        if argv[i - 1] == "--workers" and arg.isdigit():
+            continue
+        args.append(arg)
+    return args
+
+
 def solve(grid: list[str]) -> int:
     """
     Solve the puzzle.
 
+    Uses the NumPy backend when it is installed, pure Python otherwise.
+
     Args:
         grid: List of strings representing the grid
 
     Returns:
         Number of accessible paper rolls
     """
+    if np is not None:
+        return count_accessible_rolls_numpy(grid)
     return count_accessible_rolls(grid)
 
 
-def solve_from_file(filename: str) -> int:
+def solve_from_file(
+    filename: str,
+    packed: bool = False,
+    banded: bool = False,
+    parallel: bool = False,
+    workers: int | None = None,
+) -> int:
     """Solve using input from a file."""
+    if parallel:
+        return solve_parallel(filename, workers)
+    if banded:
+        with MappedGrid.open(filename) as grid:
+            return count_accessible_rolls_banded(grid)
+    if packed:
+        return count_accessible_rolls_packed(PackedGrid.from_file(filename))
     with open(filename, "r") as f:
         grid = [line.rstrip("\n") for line in f]
     return solve(grid)
@@ -82,10 +416,14 @@ def solve_from_file(filename: str) -> int:
 def main():
     """Main entry point - solve puzzle."""
     # Parse command line arguments
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    parallel, workers = parse_workers_arg(sys.argv)
+    args = positional_args(sys.argv)
+    input_file = args[0] if args else "input.txt"
+    packed = "--packed" in sys.argv
+    banded = "--banded" in sys.argv
 
     # Solve the actual puzzle
-    answer = solve_from_file(input_file)
+    answer = solve_from_file(input_file, packed, banded, parallel, workers)
     print(answer)
 
 
@@ -12,7 +12,20 @@ Grid notation:
 - '.' = empty space
 """
 
+import mmap
+import shutil
 import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from part_1 import (
+    BAND_ROWS,
+    MappedGrid,
+    PackedGrid,
+    accessible_masks,
+    accessible_row_mask,
+)
 
 
 def count_adjacent_rolls(grid: list[list[str]], r: int, c: int) -> int:
@@ -66,6 +79,70 @@ def find_accessible_rolls(grid: list[list[str]]) -> list[tuple[int, int]]:
     return accessible
 
 
+def removal_rounds(grid: list[str]) -> list[int]:
+    """
+    Peel accessible rolls round by round with a worklist, in O(rows × cols).
+
+    Neighbour counts (degrees) are computed once. Each round removes its
+    rolls and decrements their neighbours' degrees; a roll whose degree
+    drops below 4 joins the next round's worklist. This matches removing
+    all accessible rolls simultaneously each round, but every roll is
+    removed at most once and each removal touches only its 8 neighbours.
+
+    Args:
+        grid: List of strings representing the initial grid
+
+    Returns:
+        Number of rolls removed in each round, in order
+    """
+    if not grid:
+        return []
+
+    # Flatten into a grid with a one-cell empty border, so neighbours of
+    # real cells never need bounds checks
+    width = max(len(row) for row in grid) + 2
+    alive = bytearray(width * (len(grid) + 2))
+    for r, row in enumerate(grid, start=1):
+        for c, cell in enumerate(row, start=1):
+            if cell == "@":
+                alive[r * width + c] = 1
+
+    offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+    rolls = [i for i, is_roll in enumerate(alive) if is_roll]
+    degree = [0] * len(alive)
+    for i in rolls:
+        degree[i] = sum(alive[i + offset] for offset in offsets)
+
+    # Rolls already scheduled for removal
+    queued = bytearray(len(alive))
+    current = []
+    for i in rolls:
+        if degree[i] < 4:
+            queued[i] = 1
+            current.append(i)
+
+    rounds = []
+    while current:
+        rounds.append(len(current))
+
+        # Remove the whole round first, as removal is simultaneous
+        for i in current:
+            alive[i] = 0
+
+        next_round = []
+        for i in current:
+            for offset in offsets:
+                j = i + offset
+                if alive[j]:
+                    degree[j] -= 1
+                    if degree[j] < 4 and not queued[j]:
+                        queued[j] = 1
+                        next_round.append(j)
+        current = next_round
+
+    return rounds
+
+
 def remove_rolls_iteratively(grid: list[str]) -> int:
     """
     Iteratively remove accessible rolls until no more can be removed.
@@ -76,12 +153,152 @@ def remove_rolls_iteratively(grid: list[str]) -> int:
     Returns:
         Total number of rolls removed
     """
+    return sum(removal_rounds(grid))
+
+
+def removal_rounds_packed(grid: PackedGrid) -> list[int]:
+    """
+    Round-by-round removal on a bit-packed grid.
+
+    Each round computes every row's accessible bitset from the current rows
+    (three-row window with bit-sliced neighbour counts), then clears them.
+    The grid is copied first, so the caller's grid is left untouched.
+
+    Args:
+        grid: Bit-packed grid
+
+    Returns:
+        Number of rolls removed in each round, in order
+    """
+    current = PackedGrid(list(grid.rows), grid.width)
+    rounds = []
+
+    while True:
+        masks = list(accessible_masks(current))
+        removed = sum(mask.bit_count() for mask in masks)
+        if removed == 0:
+            break
+
+        # Clear all accessible rolls at once (simultaneous removal)
+        current.rows = [row & ~mask for row, mask in zip(current.rows, masks)]
+        rounds.append(removed)
+
+    return rounds
+
+
+def peel_band(rows: list[int], mask: int) -> int:
+    """
+    Remove accessible rolls from a band until none are left, in place.
+
+    rows[0] and rows[-1] are the halo rows: they count as neighbours but
+    are never changed here, since they belong to the adjacent bands.
+
+    Returns:
+        Number of rolls removed from the band
+    """
+    removed = 0
+    while True:
+        masks = [
+            accessible_row_mask(rows[i - 1], rows[i], rows[i + 1], mask)
+            for i in range(1, len(rows) - 1)
+        ]
+        count = sum(row_mask.bit_count() for row_mask in masks)
+        if count == 0:
+            return removed
+        for i, row_mask in enumerate(masks, start=1):
+            rows[i] &= ~row_mask
+        removed += count
+
+
+@contextmanager
+def open_scratch_grid(filename: str) -> Iterator[MappedGrid]:
+    """
+    Map a writable scratch copy of a grid file.
+
+    The copy lives in a temporary file, so removals are written to disk
+    pages the OS can evict rather than to memory. The input is left as is.
+    """
+    with open(filename, "rb") as src, tempfile.TemporaryFile() as scratch:
+        width = len(src.readline().rstrip(b"\n"))
+        if not width:
+            yield MappedGrid(bytearray(), 0)
+            return
+        src.seek(0)
+        shutil.copyfileobj(src, scratch)
+        scratch.flush()
+        with mmap.mmap(scratch.fileno(), 0, access=mmap.ACCESS_WRITE) as buffer:
+            yield MappedGrid(buffer, width)
+
+
+def remove_rolls_banded(grid: MappedGrid, band_rows: int = BAND_ROWS) -> int:
+    """
+    Out-of-core `remove_rolls_iteratively` over a writable memory-mapped grid.
+
+    Each band is loaded with its one-row halo, peeled until nothing in it
+    is accessible and written back. Removing a band's first or last row
+    changes the halo of the band above or below, so that band is queued
+    again; the loop ends when no band is queued. Only one band (plus halo)
+    is packed at a time.
+
+    The rolls that survive are the same whatever order removals happen in:
+    a removal only lowers neighbour counts, so any roll the round-by-round
+    simulation removes is removed here too, and vice versa. The total
+    therefore matches, although per-round counts are not kept.
+
+    Args:
+        grid: Writable memory-mapped grid, updated in place
+        band_rows: Rows per band
+
+    Returns:
+        Total number of rolls removed
+    """
+    bands = list(grid.bands(band_rows))
+    queued = [True] * len(bands)
+    pending = list(range(len(bands)))
+    total = 0
+
+    while pending:
+        b = pending.pop()
+        queued[b] = False
+        start, stop = bands[b]
+        rows = grid.band(start, stop)
+        before = list(rows)
+        removed = peel_band(rows, grid.mask)
+        if removed == 0:
+            continue
+
+        total += removed
+        for i in range(1, len(rows) - 1):
+            if rows[i] != before[i]:
+                grid.store_row(start + i - 1, rows[i])
+
+        # Pass boundary changes on to the neighbouring bands
+        for neighbor, i in ((b - 1, 1), (b + 1, len(rows) - 2)):
+            if rows[i] == before[i] or not 0 <= neighbor < len(bands):
+                continue
+            if not queued[neighbor]:
+                queued[neighbor] = True
+                pending.append(neighbor)
+
+    return total
+
+
+def removal_rounds_rescan(grid: list[str]) -> list[int]:
+    """
+    Reference round-by-round removal that rescans the whole grid each round.
+
+    Args:
+        grid: List of strings representing the initial grid
+
+    Returns:
+        Number of rolls removed in each round, in order
+    """
     if not grid:
-        return 0
+        return []
 
     # Convert to mutable 2D list
     mutable_grid = [list(row) for row in grid]
-    total_removed = 0
+    rounds = []
 
     while True:
         # Find all accessible rolls in current state
@@ -95,9 +312,9 @@ def remove_rolls_iteratively(grid: list[str]) -> int:
         for r, c in accessible:
             mutable_grid[r][c] = "."
 
-        total_removed += len(accessible)
+        rounds.append(len(accessible))
 
-    return total_removed
+    return rounds
 
 
 def solve(grid: list[str]) -> int:
@@ -113,8 +330,13 @@ def solve(grid: list[str]) -> int:
     return remove_rolls_iteratively(grid)
 
 
-def solve_from_file(filename: str) -> int:
+def solve_from_file(filename: str, packed: bool = False, banded: bool = False) -> int:
     """Solve using input from a file."""
+    if banded:
+        with open_scratch_grid(filename) as grid:
+            return remove_rolls_banded(grid)
+    if packed:
+        return sum(removal_rounds_packed(PackedGrid.from_file(filename)))
     with open(filename, "r") as f:
         grid = [line.rstrip("\n") for line in f]
     return solve(grid)
@@ -123,10 +345,21 @@ def solve_from_file(filename: str) -> int:
 def main():
     """Main entry point - solve puzzle."""
     # Parse command line arguments
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    input_file = args[0] if args else "input.txt"
+
+    if "--rounds" in sys.argv:
+        # Print how many rolls each round removes, one round per line
+        with open(input_file, "r") as f:
+            grid = [line.rstrip("\n") for line in f]
+        for removed in removal_rounds(grid):
+            print(removed)
+        return
 
     # Solve the actual puzzle
-    answer = solve_from_file(input_file)
+    answer = solve_from_file(
+        input_file, packed="--packed" in sys.argv, banded="--banded" in sys.argv
+    )
     print(answer)
 
 
@@ -3,7 +3,31 @@
 Tests for Day 4: Printing Department
 """
 
+import os
+import random
+import sys
+import tempfile
+import time
+
+import part_1
+from part_1 import (
+    MappedGrid,
+    PackedGrid,
+    count_accessible_rolls,
+    count_accessible_rolls_banded,
+    count_accessible_rolls_packed,
+    parse_workers_arg,
+    positional_args,
+    solve_parallel,
+)
 from part_1 import solve as solve_part1
+from part_2 import (
+    open_scratch_grid,
+    removal_rounds,
+    removal_rounds_packed,
+    removal_rounds_rescan,
+    remove_rolls_banded,
+)
 from part_2 import solve as solve_part2
 
 
@@ -155,6 +179,191 @@ def test_line_part2():
     print(f"✓ Part 2 line test passed: total removed = {result}")
 
 
+def random_grid(rng: random.Random, rows: int, cols: int, density: float) -> list[str]:
+    """Generate a random grid with the given roll density."""
+    return [
+        "".join("@" if rng.random() < density else "." for _ in range(cols))
+        for _ in range(rows)
+    ]
+
+
+def test_numpy_backend_part1():
+    """Cross-check the NumPy box-sum backend against the pure-Python scan."""
+    if part_1.np is None:
+        print("- NumPy not installed, skipping NumPy backend test")
+        return
+    rng = random.Random(16)
+    for _ in range(100):
+        grid = random_grid(rng, rng.randint(1, 30), rng.randint(1, 30), rng.random())
+        expected = count_accessible_rolls(grid)
+        result = part_1.count_accessible_rolls_numpy(grid)
+        assert result == expected, f"Expected {expected}, got {result}"
+    print("✓ NumPy backend matches pure-Python scan on random grids")
+
+
+def test_removal_rounds_part2():
+    """Test worklist peeling round counts against the full-rescan reference."""
+    grid = [
+        "..@@.@@@@.",
+        "@@@.@.@.@@",
+        "@@@@@.@.@@",
+        "@.@@@@..@.",
+        "@@.@@@@.@@",
+        ".@@@@@@@.@",
+        ".@.@.@.@@@",
+        "@.@@@.@@@@",
+        ".@@@@@@@@.",
+        "@.@.@@@.@.",
+    ]
+    rounds = removal_rounds(grid)
+    assert rounds[:2] == [13, 12], f"Expected rounds to start 13, 12, got {rounds}"
+    assert sum(rounds) == 43, f"Expected 43 total, got {sum(rounds)}"
+
+    rng = random.Random(17)
+    for _ in range(100):
+        grid = random_grid(rng, rng.randint(1, 25), rng.randint(1, 25), rng.random())
+        expected = removal_rounds_rescan(grid)
+        result = removal_rounds(grid)
+        assert result == expected, f"Expected {expected}, got {result}"
+    print("✓ Part 2: Worklist peeling matches full rescans round by round")
+
+
+def test_packed_grid():
+    """Test the bit-packed grid against the list-of-strings solvers."""
+    grid = PackedGrid.from_lines(["@.@@\n", "....\n", ".@.."])
+    assert grid.rows == [0b1101, 0, 0b0010], f"Unexpected packing {grid.rows}"
+    assert grid.width == 4, f"Expected width 4, got {grid.width}"
+
+    rng = random.Random(18)
+    for _ in range(100):
+        lines = random_grid(rng, rng.randint(1, 25), rng.randint(1, 90), rng.random())
+        packed = PackedGrid.from_lines(lines)
+        expected = count_accessible_rolls(lines)
+        result = count_accessible_rolls_packed(packed)
+        assert result == expected, f"Part 1: expected {expected}, got {result}"
+        expected_rounds = removal_rounds(lines)
+        result_rounds = removal_rounds_packed(packed)
+        assert result_rounds == expected_rounds, (
+            f"Part 2: expected {expected_rounds}, got {result_rounds}"
+        )
+    print("✓ Bit-packed grid matches list-of-strings solvers")
+
+
+def test_banded_grid():
+    """Test the memory-mapped band solvers against the in-memory solvers."""
+    rng = random.Random(19)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "grid.txt")
+        for trial in range(60):
+            rows, cols = rng.randint(1, 30), rng.randint(1, 70)
+            lines = random_grid(rng, rows, cols, rng.random())
+            text = "\n".join(lines) + ("\n" if trial % 2 else "")
+            with open(filename, "w") as f:
+                f.write(text)
+
+            expected = count_accessible_rolls(lines)
+            expected_total = sum(removal_rounds(lines))
+            for band_rows in (1, 2, 3, 7, 64):
+                with MappedGrid.open(filename) as grid:
+                    assert grid.height == len(lines), "Unexpected row count"
+                    result = count_accessible_rolls_banded(grid, band_rows)
+                assert result == expected, (
+                    f"Part 1 (bands of {band_rows}): expected {expected}, got {result}"
+                )
+                with open_scratch_grid(filename) as grid:
+                    result = remove_rolls_banded(grid, band_rows)
+                assert result == expected_total, (
+                    f"Part 2 (bands of {band_rows}): "
+                    f"expected {expected_total}, got {result}"
+                )
+
+            # The scratch copy takes the removals, not the input file
+            with open(filename) as f:
+                assert f.read() == text, "Input file was modified"
+
+        # Ragged rows, stray characters and bad lengths raise instead of misreading
+        for text in ["@@@\n@@\n@@@\n", "@@@ \n@@@.\n", "@@@\n@@@@\n", "@.@\n@x@\n"]:
+            with open(filename, "w") as f:
+                f.write(text)
+            for solve_banded, open_grid in (
+                (count_accessible_rolls_banded, MappedGrid.open),
+                (remove_rolls_banded, open_scratch_grid),
+            ):
+                try:
+                    with open_grid(filename) as grid:
+                        solve_banded(grid)
+                except ValueError:
+                    pass
+                else:
+                    raise AssertionError(f"Malformed grid {text!r} was accepted")
+
+        with open(filename, "w") as f:
+            pass
+        with MappedGrid.open(filename) as grid:
+            assert count_accessible_rolls_banded(grid) == 0
+        with open_scratch_grid(filename) as grid:
+            assert remove_rolls_banded(grid) == 0
+    print("✓ Banded memory-mapped solvers match in-memory solvers")
+
+
+def test_solve_parallel():
+    """Test the process-pool band solver against the serial solver."""
+    rng = random.Random(20)
+    lines = random_grid(rng, 97, 60, 0.6)
+    expected = count_accessible_rolls(lines)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "grid.txt")
+        with open(filename, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+        # Row ranges split at every position along the grid
+        with MappedGrid.open(filename) as grid:
+            for split in range(len(lines) + 1):
+                above = count_accessible_rolls_banded(grid, 8, 0, split)
+                below = count_accessible_rolls_banded(grid, 8, split)
+                result = above + below
+                assert result == expected, f"Split at row {split}: got {result}"
+
+        for workers in (2, 3, 200):
+            result = solve_parallel(filename, workers, min_bytes=0)
+            assert result == expected, f"{workers} workers: got {result}"
+        assert solve_parallel(filename, 3) == expected, "Serial fallback mismatch"
+
+    # The worker count is removed by position, however it is spelled
+    for argv, expected in [
+        (["part_1.py", "--workers", "08", "grid.txt"], (True, 8, ["grid.txt"])),
+        (["part_1.py", "--workers", "grid.txt"], (True, None, ["grid.txt"])),
+    ]:
+        result = (*parse_workers_arg(argv), positional_args(argv))
+        assert result == expected, f"{argv}: expected {expected}, got {result}"
+    print("✓ Parallel band solver matches serial solver")
+
+
+def benchmark_parallel(size: int = 4000, workers: tuple[int, ...] = (1, 2, 4, 8, 16)):
+    """Time the process-pool Part 1 solver on a random size × size grid."""
+    rng = random.Random(0)
+    print(f"Benchmarking Day 4 Part 1 on a {size:,} × {size:,} grid...")
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "grid.txt")
+        with open(filename, "w") as f:
+            f.writelines(
+                "".join(rng.choice("@@.") for _ in range(size)) + "\n"
+                for _ in range(size)
+            )
+
+        baseline = None
+        for count in workers:
+            start = time.perf_counter()
+            result = solve_parallel(filename, count, min_bytes=0)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"{count:>2} workers: {elapsed * 1000:8.1f}ms "
+                f"({baseline / elapsed:.2f}x speedup, {result:,} accessible)"
+            )
+    print(f"({os.cpu_count()} CPUs available)")
+
+
 def run_tests():
     """Run all tests."""
     print("Running Day 4 tests...\n")
@@ -164,13 +373,24 @@ def run_tests():
     test_surrounded_roll_part1()
     test_line_of_rolls_part1()
     test_no_rolls_part1()
+    test_numpy_backend_part1()
     print("\n=== Part 2 Tests ===")
     test_example_part2()
     test_single_roll_part2()
     test_surrounded_part2()
     test_line_part2()
+    test_removal_rounds_part2()
+    print("\n=== Bit-Packed Grid Tests ===")
+    test_packed_grid()
+    print("\n=== Banded Memory-Mapped Tests ===")
+    test_banded_grid()
+    test_solve_parallel()
     print("\n✓ All tests passed!")
 
 
 if __name__ == "__main__":
-    run_tests()
+    if "--benchmark" in sys.argv:
+        args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+        benchmark_parallel(int(args[0]) if args else 4000)
+    else:
+        run_tests()
@@ -6,18 +6,50 @@ https://adventofcode.com/2025/day/5
 Determine how many available ingredient IDs are fresh based on the fresh ID ranges.
 """
 
+import heapq
 import sys
+import tempfile
+from bisect import bisect_right
+from contextlib import ExitStack
+from itertools import islice
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to per-ID bisect lookups
+    np = None
 
-def solve(data):
+# Available-ID lines parsed per NumPy batch when streaming a file
+ID_BATCH_LINES = 1 << 16
+
+# Items sorted in memory per spilled run in the offline (external sort) mode
+RUN_SIZE = 1 << 20
+
+# Most run files merged at once, which bounds the open files per sort
+MERGE_FAN_IN = 32
+
+# Bounds of the int64 values the NumPy batch path can represent
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def parse_ranges(range_lines):
+    """Parse "start-end" lines into inclusive (start, end) tuples."""
+    fresh_ranges = []
+    for line in range_lines:
+        start, end = map(int, line.split("-"))
+        fresh_ranges.append((start, end))
+    return fresh_ranges
+
+
+def parse_database(data):
     """
-    Solve the cafeteria ingredient freshness puzzle.
+    Split the database into fresh ID ranges and available ingredient IDs.
 
     Args:
         data: String containing the database with fresh ID ranges and available IDs
 
     Returns:
-        Number of available ingredient IDs that are fresh
+        (list of inclusive (start, end) tuples, list of available IDs)
     """
     lines = data.strip().split("\n")
 
@@ -25,16 +57,337 @@ def solve(data):
     blank_line_idx = lines.index("")
 
     # Parse fresh ID ranges
-    fresh_ranges = []
-    for i in range(blank_line_idx):
-        start, end = map(int, lines[i].split("-"))
-        fresh_ranges.append((start, end))
+    fresh_ranges = parse_ranges(lines[:blank_line_idx])
 
     # Parse available ingredient IDs
     available_ids = []
     for i in range(blank_line_idx + 1, len(lines)):
         available_ids.append(int(lines[i]))
 
+    return fresh_ranges, available_ids
+
+
+def iter_fresh_ranges(lines):
+    """
+    Consume lines up to the blank separator, yielding them as fresh ranges.
+
+    Blank lines before the first range are skipped, as `data.strip()` would.
+    The iterator is left at the first available-ID line.
+    """
+    seen_range = False
+    for line in lines:
+        line = line.strip()
+        if line:
+            seen_range = True
+            start, end = map(int, line.split("-"))
+            yield start, end
+        elif seen_range:
+            return
+
+
+def read_fresh_ranges(lines):
+    """Consume lines up to the blank separator and parse them as fresh ranges."""
+    return list(iter_fresh_ranges(lines))
+
+
+def merge_ranges(fresh_ranges):
+    """
+    Sort ranges and merge overlapping or adjacent ones.
+
+    Args:
+        fresh_ranges: List of inclusive (start, end) tuples
+
+    Returns:
+        Disjoint, sorted list of inclusive (start, end) tuples
+    """
+    merged_ranges = []
+    for start, end in sorted(fresh_ranges):
+        if merged_ranges and start <= merged_ranges[-1][1] + 1:
+            # Overlapping or adjacent - extend the last range
+            merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], end))
+        else:
+            # Non-overlapping - add as new range
+            merged_ranges.append((start, end))
+    return merged_ranges
+
+
+class FreshIndex:
+    """
+    Merged fresh ranges as parallel sorted `starts` and `ends` lists.
+
+    The ranges are sorted and merged once; after that they are disjoint, so
+    the only range that can contain an ID is the last one starting at or
+    before it, found with one binary search: O(log R) per lookup.
+
+    When NumPy is installed and every bound fits in int64, int64 copies of
+    the lists are built once as well (`arrays`) for batch lookups;
+    otherwise `arrays` is None and lookups use the lists.
+    """
+
+    def __init__(self, fresh_ranges):
+        merged_ranges = merge_ranges(fresh_ranges)
+        self.starts = [start for start, _ in merged_ranges]
+        self.ends = [end for _, end in merged_ranges]
+
+        # Starts and ends both ascend, so only the outermost bounds can overflow
+        self.arrays = None
+        if np is not None and (
+            not self.starts
+            or (INT64_MIN <= self.starts[0] and self.ends[-1] <= INT64_MAX)
+        ):
+            self.arrays = (
+                np.array(self.starts, dtype=np.int64),
+                np.array(self.ends, dtype=np.int64),
+            )
+
+    def __contains__(self, ingredient_id):
+        i = bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+
+    def count_fresh(self, ingredient_ids):
+        """Count how many of the given IDs fall within a fresh range."""
+        return sum(1 for ingredient_id in ingredient_ids if ingredient_id in self)
+
+    def count_fresh_numpy(self, ingredient_ids):
+        """
+        Vectorized `count_fresh` for an int64 array of IDs.
+
+        One `searchsorted` finds every ID's candidate range at once, and one
+        comparison with the gathered range ends marks the fresh IDs. Needs
+        `arrays`, i.e. NumPy and ranges within int64.
+        """
+        if not self.starts:
+            return 0
+        starts, ends = self.arrays
+        candidates = np.searchsorted(starts, ingredient_ids, side="right") - 1
+        # IDs before the first range get candidate -1; clamp it for the gather
+        fresh = (candidates >= 0) & (ingredient_ids <= ends[np.maximum(candidates, 0)])
+        return int(np.count_nonzero(fresh))
+
+    def count_fresh_text(self, text):
+        """
+        Count the fresh IDs in whitespace-separated text.
+
+        Uses one NumPy batch when `arrays` is available. `np.fromstring`
+        saturates values outside int64 to INT64_MAX, so a batch containing
+        that value is recounted with Python ints, as is everything when
+        NumPy or `arrays` is unavailable.
+        """
+        if self.arrays is not None:
+            ids = np.fromstring(text, dtype=np.int64, sep="\n")
+            if not ids.size or ids.max() < INT64_MAX:
+                return self.count_fresh_numpy(ids)
+        return self.count_fresh(int(token) for token in text.split())
+
+
+def solve_numpy(data):
+    """
+    Count fresh IDs with the ID section parsed straight into an int64 array.
+
+    Falls back to per-ID lookups when a range bound or ID is outside int64.
+
+    Args:
+        data: String containing the database with fresh ID ranges and available IDs
+
+    Returns:
+        Number of available ingredient IDs that are fresh
+    """
+    range_section, _, id_section = data.strip().partition("\n\n")
+    fresh_ranges = parse_ranges(range_section.split("\n"))
+    return FreshIndex(fresh_ranges).count_fresh_text(id_section)
+
+
+def solve(data):
+    """
+    Solve the cafeteria ingredient freshness puzzle.
+
+    Uses the NumPy batch path when NumPy is installed, per-ID bisect otherwise.
+
+    Args:
+        data: String containing the database with fresh ID ranges and available IDs
+
+    Returns:
+        Number of available ingredient IDs that are fresh
+    """
+    if np is not None:
+        return solve_numpy(data)
+
+    fresh_ranges, available_ids = parse_database(data)
+    return FreshIndex(fresh_ranges).count_fresh(available_ids)
+
+
+def solve_stream(lines):
+    """
+    Count fresh IDs while reading the database one line at a time.
+
+    The range section is read into a `FreshIndex`; the ID section is then
+    streamed through it, in NumPy batches of `ID_BATCH_LINES` lines when
+    NumPy is installed, keeping only the running count. Memory is bounded
+    by the range index (plus one batch), not by the number of IDs.
+
+    Args:
+        lines: Iterable of database lines, e.g. an open file
+
+    Returns:
+        Number of available ingredient IDs that are fresh
+    """
+    lines = iter(lines)
+    index = FreshIndex(read_fresh_ranges(lines))
+
+    if np is None:
+        return index.count_fresh(int(line) for line in lines if line.strip())
+
+    fresh_count = 0
+    while batch := list(islice(lines, ID_BATCH_LINES)):
+        fresh_count += index.count_fresh_text("".join(batch))
+    return fresh_count
+
+
+def close_runs(runs):
+    """Close run files (closing one twice is harmless)."""
+    for run in runs:
+        run.close()
+
+
+def merge_runs(runs, parse_item):
+    """Lazily k-way merge sorted run files into one sorted stream of items."""
+    return heapq.merge(*(map(parse_item, run) for run in runs))
+
+
+def merge_to_run(runs, parse_item, format_item):
+    """Merge sorted run files into one new run file, closing the inputs."""
+    try:
+        # The merged run is returned open, so it cannot live in a with block
+        merged = tempfile.TemporaryFile("w+")  # noqa: SIM115
+        try:
+            merged.writelines(map(format_item, merge_runs(runs, parse_item)))
+            merged.seek(0)
+        except BaseException:
+            merged.close()
+            raise
+    finally:
+        close_runs(runs)
+    return merged
+
+
+def spill_sorted_runs(
+    items, format_item, parse_item, run_size=RUN_SIZE, fan_in=MERGE_FAN_IN
+):
+    """
+    External sort down to at most `fan_in` sorted run files.
+
+    Items are read `run_size` at a time, sorted in memory and written one
+    per line with `format_item`. Runs are kept in levels: once a level
+    holds `fan_in` runs they are merged into one run on the next level, and
+    the runs left at the end are merged, smallest first, until at most
+    `fan_in` remain. So no more than about `fan_in` files per level are
+    open at once, and each item is rewritten once per level,
+    O(log_fan_in(items / run_size)) times.
+
+    All of `items` is consumed before this returns. The returned run files
+    are rewound, ready for `merge_runs`, and the caller must close them
+    (`close_runs`). If anything fails, every run file is closed first.
+    """
+    items = iter(items)
+    levels = [[]]  # levels[k] holds runs that each merged fan_in**k spills
+    try:
+        while batch := sorted(islice(items, run_size)):
+            # Runs outlive this loop (the caller merges them), so no with block
+            run = tempfile.TemporaryFile("w+")  # noqa: SIM115
+            levels[0].append(run)
+            run.writelines(map(format_item, batch))
+            run.seek(0)
+
+            # Carry full levels upwards, like incrementing a base-fan_in counter
+            k = 0
+            while len(levels[k]) == fan_in:
+                group, levels[k] = levels[k], []
+                if k + 1 == len(levels):
+                    levels.append([])
+                levels[k + 1].append(merge_to_run(group, parse_item, format_item))
+                k += 1
+
+        # Largest runs first, so the smallest are merged in the final passes
+        runs = [run for level in reversed(levels) for run in level]
+        levels = [runs]
+        while len(runs) > fan_in:
+            group = runs[-fan_in:]
+            del runs[-fan_in:]
+            runs.append(merge_to_run(group, parse_item, format_item))
+        return runs
+    except BaseException:
+        for level in levels:
+            close_runs(level)
+        raise
+
+
+def format_range(fresh_range):
+    """Serialize a range as a run-file line."""
+    start, end = fresh_range
+    return f"{start} {end}\n"
+
+
+def parse_range(line):
+    """Parse a run-file line back into a (start, end) tuple."""
+    start, end = line.split()
+    return int(start), int(end)
+
+
+def format_id(ingredient_id):
+    """Serialize an ID as a run-file line."""
+    return f"{ingredient_id}\n"
+
+
+def solve_offline(lines, run_size=RUN_SIZE, fan_in=MERGE_FAN_IN):
+    """
+    Count fresh IDs with an external sort of both sections and a merge-join.
+
+    Ranges and IDs are each spilled to sorted runs on disk, so neither has
+    to fit in memory. The merged, sorted streams are then walked together:
+    `reach` is the largest end among ranges starting at or before the
+    current ID, and the ID is fresh exactly when it is <= `reach`. All disk
+    access is sequential and the total work is O((R + Q) log(R + Q)).
+    Merges read at most `fan_in` runs at once, so the number of open files
+    stays bounded however large the input is.
+
+    Args:
+        lines: Iterable of database lines, e.g. an open file
+        run_size: Items sorted in memory per run
+        fan_in: Most run files merged at once
+
+    Returns:
+        Number of available ingredient IDs that are fresh
+    """
+    lines = iter(lines)
+    with ExitStack() as stack:
+        range_runs = spill_sorted_runs(
+            iter_fresh_ranges(lines), format_range, parse_range, run_size, fan_in
+        )
+        stack.callback(close_runs, range_runs)
+        ids = (int(line) for line in lines if line.strip())
+        id_runs = spill_sorted_runs(ids, format_id, int, run_size, fan_in)
+        stack.callback(close_runs, id_runs)
+
+        sorted_ranges = merge_runs(range_runs, parse_range)
+        sorted_ids = merge_runs(id_runs, int)
+        fresh_count = 0
+        reach = None
+        next_range = next(sorted_ranges, None)
+        for ingredient_id in sorted_ids:
+            # Take in every range that starts at or before this ID
+            while next_range is not None and next_range[0] <= ingredient_id:
+                if reach is None or next_range[1] > reach:
+                    reach = next_range[1]
+                next_range = next(sorted_ranges, None)
+            if reach is not None and ingredient_id <= reach:
+                fresh_count += 1
+        return fresh_count
+
+
+def solve_linear(data):
+    """Reference solver: check every available ID against every fresh range."""
+    fresh_ranges, available_ids = parse_database(data)
+
     # Count how many available IDs are fresh
     fresh_count = 0
     for ingredient_id in available_ids:
@@ -47,17 +400,19 @@ def solve(data):
     return fresh_count
 
 
-def solve_from_file(filename):
-    """Read input from file and solve the puzzle."""
+def solve_from_file(filename, offline=False):
+    """Stream input from file and solve the puzzle."""
     with open(filename, "r") as f:
-        data = f.read()
-    return solve(data)
+        if offline:
+            return solve_offline(f)
+        return solve_stream(f)
 
 
 def main():
     """Main entry point for the solution."""
-    filename = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-    result = solve_from_file(filename)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    filename = args[0] if args else "input.txt"
+    result = solve_from_file(filename, offline="--offline" in sys.argv)
     print(result)
 
 
@@ -6,43 +6,164 @@ https://adventofcode.com/2025/day/5
 Count the total number of ingredient IDs considered fresh by the fresh ID ranges.
 """
 
+import random
 import sys
 
+from part_1 import merge_ranges, read_fresh_ranges
 
-def solve(data):
-    """
-    Count total ingredient IDs considered fresh by all ranges.
 
-    Args:
-        data: String containing the database with fresh ID ranges
+class _Node:
+    """Skip-list node: one merged range and its forward pointer per level."""
 
-    Returns:
-        Total count of ingredient IDs covered by all fresh ranges
+    __slots__ = ("end", "next", "start")
+
+    def __init__(self, start, end, level):
+        self.start = start
+        self.end = end
+        self.next = [None] * level
+
+
+class IntervalSet:
+    """
+    Mutable set of fresh IDs, stored as disjoint merged ranges in a skip list.
+
+    The ranges are kept sorted by start, disjoint and non-adjacent (the same
+    invariant `merge_ranges` produces), so the only range that can contain
+    an ID is its predecessor by start. The skip list gives expected
+    O(log n) searches; `insert` and `delete` do one search and then only
+    touch the ranges they merge, trim or split, and each range is removed
+    at most once after it is created, so they are O(log n) amortized.
+    `total_count` (the Part 2 answer) is updated as ranges change, so
+    reading it is O(1).
     """
-    lines = data.strip().split("\n")
-
-    # Find the blank line separating ranges from available IDs
-    blank_line_idx = lines.index("")
-
-    # Parse fresh ID ranges
-    fresh_ranges = []
-    for i in range(blank_line_idx):
-        start, end = map(int, lines[i].split("-"))
-        fresh_ranges.append((start, end))
-
-    # Merge overlapping ranges to avoid double-counting
-    # Sort ranges by start position
-    fresh_ranges.sort()
-
-    # Merge overlapping or adjacent ranges
-    merged_ranges = []
-    for start, end in fresh_ranges:
-        if merged_ranges and start <= merged_ranges[-1][1] + 1:
-            # Overlapping or adjacent - extend the last range
-            merged_ranges[-1] = (merged_ranges[-1][0], max(merged_ranges[-1][1], end))
-        else:
-            # Non-overlapping - add as new range
-            merged_ranges.append((start, end))
+
+    MAX_LEVEL = 32
+
+    def __init__(self, fresh_ranges=(), seed=None):
+        self.head = _Node(None, None, self.MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        self.total_count = 0
+        self.random = random.Random(seed)
+
+        # Bulk load: the merged ranges arrive sorted, so append each one
+        # after the last node of every level it joins. Inverted ranges are
+        # empty, as in insert()
+        tails = [self.head] * self.MAX_LEVEL
+        valid_ranges = [(start, end) for start, end in fresh_ranges if start <= end]
+        for start, end in merge_ranges(valid_ranges):
+            node = _Node(start, end, self._random_level())
+            for i in range(len(node.next)):
+                tails[i].next[i] = node
+                tails[i] = node
+            self.level = max(self.level, len(node.next))
+            self.size += 1
+            self.total_count += end - start + 1
+
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and self.random.random() < 0.5:
+            level += 1
+        return level
+
+    def _predecessors(self, key):
+        """Return, per level, the last node whose start is below `key`."""
+        update = [self.head] * self.MAX_LEVEL
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].start < key:
+                node = node.next[i]
+            update[i] = node
+        return update
+
+    def _link(self, update, start, end):
+        """Insert a new range node after the per-level predecessors."""
+        node = _Node(start, end, self._random_level())
+        self.level = max(self.level, len(node.next))
+        for i in range(len(node.next)):
+            node.next[i] = update[i].next[i]
+            update[i].next[i] = node
+        self.size += 1
+        self.total_count += end - start + 1
+        return node
+
+    def _unlink(self, update, node):
+        """Remove `node`, which directly follows the per-level predecessors."""
+        for i in range(len(node.next)):
+            if update[i].next[i] is node:
+                update[i].next[i] = node.next[i]
+        self.size -= 1
+        self.total_count -= node.end - node.start + 1
+
+    def __contains__(self, ingredient_id):
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].start <= ingredient_id:
+                node = node.next[i]
+        return node is not self.head and ingredient_id <= node.end
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node.start, node.end
+            node = node.next[0]
+
+    def __len__(self):
+        return self.size
+
+    def insert(self, start, end):
+        """Mark IDs start..end (inclusive) fresh, merging touching ranges."""
+        if start > end:
+            return
+        update = self._predecessors(start)
+        previous = update[0]
+        if previous is not self.head and previous.end >= start - 1:
+            # Overlapping or adjacent on the left - absorb the previous range
+            start = previous.start
+            end = max(end, previous.end)
+            update = self._predecessors(start)
+
+        node = update[0].next[0]
+        while node is not None and node.start <= end + 1:
+            # Overlapping or adjacent on the right - absorb the next range
+            end = max(end, node.end)
+            self._unlink(update, node)
+            node = update[0].next[0]
+
+        self._link(update, start, end)
+
+    def delete(self, start, end):
+        """Mark IDs start..end (inclusive) spoiled, trimming or splitting ranges."""
+        if start > end:
+            return
+        update = self._predecessors(start)
+        previous = update[0]
+        if previous is not self.head and previous.end >= start:
+            # The range before `start` runs into the deleted span - trim it,
+            # keeping any part past `end` as a new range
+            old_end = previous.end
+            previous.end = start - 1
+            self.total_count -= old_end - start + 1
+            if old_end > end:
+                self._link(update, end + 1, old_end)
+                return
+
+        node = update[0].next[0]
+        while node is not None and node.start <= end:
+            if node.end <= end:
+                self._unlink(update, node)
+                node = update[0].next[0]
+            else:
+                # Keep the tail past `end`; it still sorts in the same place
+                self.total_count -= end + 1 - node.start
+                node.start = end + 1
+                break
+
+
+def count_total_fresh(fresh_ranges):
+    """Count the IDs covered by the ranges, merging them to avoid double-counting."""
+    # Merge overlapping or adjacent ranges to avoid double-counting
+    merged_ranges = merge_ranges(fresh_ranges)
 
     # Count total IDs in all merged ranges
     total_count = 0
@@ -52,11 +173,24 @@ def solve(data):
     return total_count
 
 
+def solve(data):
+    """
+    Count total ingredient IDs considered fresh by all ranges.
+
+    Args:
+        data: String containing the database with fresh ID ranges
+
+    Returns:
+        Total count of ingredient IDs covered by all fresh ranges
+    """
+    # Only the range section is parsed; the available IDs are never read
+    return count_total_fresh(read_fresh_ranges(data.splitlines()))
+
+
 def solve_from_file(filename):
-    """Read input from file and solve the puzzle."""
+    """Solve from file, reading only the range section (up to the blank line)."""
     with open(filename, "r") as f:
-        data = f.read()
-    return solve(data)
+        return count_total_fresh(read_fresh_ranges(f))
 
 
 def main():
@@ -3,7 +3,15 @@
 Test suite for Day 5: Cafeteria
 """
 
+import os
+import random
+import tempfile
+
+import part_1
+import part_2
+from part_1 import FreshIndex, merge_ranges, solve_linear
 from part_1 import solve as solve_part1
+from part_2 import IntervalSet
 from part_2 import solve as solve_part2
 
 
@@ -81,6 +89,160 @@ def test_all_fresh_part1():
     print("✓ test_all_fresh_part1 passed")
 
 
+def random_database(rng, range_count, id_count, span):
+    """Build a random database string with ranges and IDs in [0, span]."""
+    lines = []
+    for _ in range(range_count):
+        start = rng.randint(0, span)
+        lines.append(f"{start}-{start + rng.randint(0, span // 10)}")
+    lines.append("")
+    lines.extend(str(rng.randint(0, span)) for _ in range(id_count))
+    return "\n".join(lines)
+
+
+def test_fresh_index_part1():
+    """Test bisect lookups in the merged index against the linear scan."""
+    index = FreshIndex([(10, 14), (3, 5), (16, 20), (12, 18)])
+    assert index.starts == [3, 10], f"Unexpected starts {index.starts}"
+    assert index.ends == [5, 20], f"Unexpected ends {index.ends}"
+    fresh = [3, 4, 5, 10, 15, 20]
+    spoiled = [0, 2, 6, 9, 21, 100]
+    assert all(ingredient_id in index for ingredient_id in fresh), "Missed a fresh ID"
+    assert not any(ingredient_id in index for ingredient_id in spoiled), "Bad match"
+    assert 1 not in FreshIndex([]), "Empty index should contain nothing"
+
+    rng = random.Random(21)
+    for _ in range(200):
+        data = random_database(rng, rng.randint(1, 20), rng.randint(1, 30), 200)
+        expected = solve_linear(data)
+        result = solve_part1(data)
+        assert result == expected, f"Expected {expected}, got {result}"
+    print("✓ test_fresh_index_part1 passed")
+
+
+def test_numpy_backend_part1():
+    """Test the searchsorted batch path against the linear scan."""
+    if part_1.np is None:
+        print("- test_numpy_backend_part1 skipped (NumPy not installed)")
+        return
+    np = part_1.np
+
+    index = FreshIndex([(3, 5), (10, 20)])
+    ids = np.array([0, 3, 5, 6, 10, 20, 21], dtype=np.int64)
+    assert index.count_fresh_numpy(ids) == 4, "Wrong batch count at boundaries"
+    assert FreshIndex([]).count_fresh_numpy(ids) == 0, "Empty index matched IDs"
+
+    # Bounds or IDs outside int64 fall back to Python ints instead of overflowing
+    big = 10**20
+    assert FreshIndex([(3, big)]).arrays is None, "int64 arrays for a huge bound"
+    for data in [
+        f"3-{big}\n\n5",
+        f"3-5\n\n{big}\n4",
+        f"3-5\n10-{big}\n\n{2**63 - 1}\n{big}\n4\n2",
+        f"3-5\n\n{2**63 - 1}\n{-big}\n4",
+    ]:
+        expected = solve_linear(data)
+        assert solve_part1(data) == expected, f"{data!r}: expected {expected}"
+        lines = data.splitlines(keepends=True)
+        assert part_1.solve_stream(lines) == expected, f"{data!r}: stream mismatch"
+
+    rng = random.Random(22)
+    for _ in range(200):
+        data = random_database(rng, rng.randint(1, 20), rng.randint(1, 30), 10**15)
+        expected = solve_linear(data)
+        result = part_1.solve_numpy(data)
+        assert result == expected, f"Expected {expected}, got {result}"
+    print("✓ test_numpy_backend_part1 passed")
+
+
+def test_stream_part1():
+    """Test the line-streaming parser with and without NumPy batches."""
+    numpy_module, batch_lines = part_1.np, part_1.ID_BATCH_LINES
+    rng = random.Random(24)
+    try:
+        part_1.ID_BATCH_LINES = 7  # Several batches per database
+        for _ in range(100):
+            data = random_database(rng, rng.randint(1, 20), rng.randint(1, 40), 10**12)
+            expected = solve_linear(data)
+            lines = ("\n\n" + data + "\n").splitlines(keepends=True)
+            for part_1.np in (numpy_module, None):
+                result = part_1.solve_stream(iter(lines))
+                assert result == expected, f"Expected {expected}, got {result}"
+    finally:
+        part_1.np, part_1.ID_BATCH_LINES = numpy_module, batch_lines
+    print("✓ test_stream_part1 passed")
+
+
+class RunFileTracker:
+    """Record the temporary files part_1 creates and the most open at once."""
+
+    def __init__(self):
+        self.files = []
+        self.peak_open = 0
+
+    def __enter__(self):
+        self.original = tempfile.TemporaryFile
+
+        def tracked(*args, **kwargs):
+            run = self.original(*args, **kwargs)
+            self.files.append(run)
+            self.peak_open = max(self.peak_open, self.open_count())
+            return run
+
+        tempfile.TemporaryFile = tracked
+        return self
+
+    def __exit__(self, *exc_info):
+        tempfile.TemporaryFile = self.original
+
+    def open_count(self):
+        return sum(not run.closed for run in self.files)
+
+
+def test_offline_part1():
+    """Test the external-sort merge-join against the linear scan."""
+    items = [5, 3, 9, 1, 3, 7, 2]
+    for fan_in, expected_runs in ((8, 3), (2, 2)):
+        runs = part_1.spill_sorted_runs(
+            items, part_1.format_id, int, run_size=3, fan_in=fan_in
+        )
+        assert len(runs) == expected_runs, f"Expected {expected_runs} runs"
+        merged = list(part_1.merge_runs(runs, int))
+        assert merged == sorted(items), f"Unexpected merge {merged}"
+        part_1.close_runs(runs)
+
+    rng = random.Random(25)
+    for trial in range(100):
+        # Small spans give duplicate IDs and nested ranges
+        span = 50 if trial % 2 else 10**12
+        data = random_database(rng, rng.randint(1, 20), rng.randint(1, 40), span)
+        expected = solve_linear(data)
+        lines = (data + "\n").splitlines(keepends=True)
+        for run_size, fan_in in ((1, 2), (1, 3), (4, 2), (1000, 32)):
+            result = part_1.solve_offline(iter(lines), run_size, fan_in)
+            assert result == expected, f"Expected {expected}, got {result}"
+
+    # 300 single-item runs per section, merged with a fan-in of 4
+    data = random_database(rng, 300, 300, 10**6)
+    with RunFileTracker() as tracker:
+        result = part_1.solve_offline(iter(data.splitlines()), run_size=1, fan_in=4)
+    assert result == solve_linear(data), "Multi-pass merge miscounted"
+    # Per sort: at most fan_in - 1 runs on each of ~log_4(300) levels, plus one
+    assert tracker.peak_open <= 2 * (3 * 5 + 1), f"{tracker.peak_open} files open"
+    assert tracker.open_count() == 0, "Run files left open"
+
+    # A bad ID while spilling must still close the already spilled range runs
+    with RunFileTracker() as tracker:
+        try:
+            part_1.solve_offline(iter(["1-5\n", "7-9\n", "\n", "3\n", "oops\n"]), 1)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Bad ID was accepted")
+    assert tracker.files and tracker.open_count() == 0, "Run files leaked"
+    print("✓ test_offline_part1 passed")
+
+
 def test_example_part2():
     """Test the example from Part 2 puzzle description."""
     data = """3-5
@@ -181,6 +343,63 @@ def test_single_id_range_part2():
     print("✓ test_single_id_range_part2 passed")
 
 
+def test_interval_set_part2():
+    """Test streaming inserts and deletes against a plain set of IDs."""
+    ranges = [(3, 5), (10, 14), (16, 20), (12, 18)]
+    fresh = IntervalSet(ranges, seed=0)
+    assert list(fresh) == [(3, 5), (10, 20)], f"Unexpected ranges {list(fresh)}"
+    assert fresh.total_count == 14, f"Expected 14, got {fresh.total_count}"
+    fresh.delete(4, 11)
+    assert list(fresh) == [(3, 3), (12, 20)], f"Unexpected ranges {list(fresh)}"
+    fresh.insert(4, 11)
+    assert list(fresh) == [(3, 20)], f"Unexpected ranges {list(fresh)}"
+    assert fresh.total_count == 18, f"Expected 18, got {fresh.total_count}"
+
+    # Inverted ranges are empty in the bulk load, as in insert()
+    fresh = IntervalSet([(5, 3), (10, 12)], seed=0)
+    assert list(fresh) == [(10, 12)], f"Unexpected ranges {list(fresh)}"
+    assert fresh.total_count == 3, f"Expected 3, got {fresh.total_count}"
+
+    rng = random.Random(23)
+    for trial in range(50):
+        initial = [(s, s + rng.randint(0, 15)) for s in rng.sample(range(200), 10)]
+        fresh = IntervalSet(initial, seed=trial)
+        expected = {i for start, end in initial for i in range(start, end + 1)}
+        for _ in range(100):
+            start = rng.randint(0, 220)
+            end = start + rng.randint(0, 25)
+            if rng.random() < 0.5:
+                fresh.insert(start, end)
+                expected.update(range(start, end + 1))
+            else:
+                fresh.delete(start, end)
+                expected.difference_update(range(start, end + 1))
+
+            assert fresh.total_count == len(expected), "total_count drifted"
+            intervals = list(fresh)
+            assert intervals == merge_ranges(intervals), "Ranges not disjoint"
+            assert len(fresh) == len(intervals), "Wrong range count"
+            probe = rng.randint(-5, 250)
+            assert (probe in fresh) == (probe in expected), f"Membership of {probe}"
+        covered = {i for start, end in fresh for i in range(start, end + 1)}
+        assert covered == expected, "Ranges cover the wrong IDs"
+    print("✓ test_interval_set_part2 passed")
+
+
+def test_ranges_only_part2():
+    """Test that Part 2 reads only up to the blank line, from a file or a string."""
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "database.txt")
+        with open(filename, "w") as f:
+            # The ID section is not valid input; Part 2 must never parse it
+            f.write("3-5\n10-14\n16-20\n12-18\n\nnot an id\n")
+        result = part_2.solve_from_file(filename)
+    assert result == 14, f"Expected 14, got {result}"
+    result = solve_part2("3-5\n10-14\n16-20\n12-18\n\nnot an id\n")
+    assert result == 14, f"Expected 14, got {result}"
+    print("✓ test_ranges_only_part2 passed")
+
+
 def run_tests():
     """Run all test functions."""
     print("\n=== Part 1 Tests ===")
@@ -189,6 +408,10 @@ def run_tests():
     test_overlapping_ranges_part1()
     test_no_fresh_part1()
     test_all_fresh_part1()
+    test_fresh_index_part1()
+    test_numpy_backend_part1()
+    test_stream_part1()
+    test_offline_part1()
 
     print("\n=== Part 2 Tests ===")
     test_example_part2()
@@ -197,6 +420,8 @@ def run_tests():
     test_non_overlapping_ranges_part2()
     test_adjacent_ranges_part2()
     test_single_id_range_part2()
+    test_interval_set_part2()
+    test_ranges_only_part2()
 
     print("\n✓ All tests passed!\n")
 